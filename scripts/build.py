@@ -8,6 +8,11 @@ All JavaScript libraries, CSS, and WASM binaries are inlined.
 Usage:
     python scripts/build.py              # Build to semantic-model-explorer.html
     python scripts/build.py --output X   # Build to custom path
+    python scripts/build.py --force      # Rebuild even if inputs are unchanged
+
+Builds are skipped when the content hashes of all inputs (and of this script)
+match the manifest in .build-cache/ next to the output, and the output itself
+is unmodified.
 
 Source structure:
     src/template.html       HTML skeleton with {{PLACEHOLDER}} markers
@@ -24,79 +29,238 @@ Source structure:
 """
 
 import argparse
+import functools
+import hashlib
+import json
 import os
+import re
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+PLACEHOLDER_RE = re.compile(rb'\{\{([A-Z0-9_]+)\}\}', re.ASCII)
+WASM_B64_MARKER = b'%%XPRESS9_WASM_B64%%'
 
-def read_file(rel_path):
-    """Read a file relative to project root."""
-    path = os.path.join(ROOT, rel_path)
-    with open(path, 'r', encoding='utf-8') as f:
+# Libraries are inlined byte-for-byte, so they are copied file-to-file
+# instead of being read into memory
+LIBRARY_FILES = {
+    'JSZIP': 'lib/jszip.min.js',
+    'CYTOSCAPE': 'lib/cytoscape.min.js',
+    'XPRESS9_GLUE': 'lib/xpress9-glue.js',
+    'HYPARQUET_WRITER': 'lib/hyparquet-writer.min.js',
+}
+
+CACHE_DIR = '.build-cache'
+INPUT_FILES = (
+    'src/template.html',
+    'src/styles.css',
+    'src/app.js',
+    'src/vertipaq.js',
+    'src/export.js',
+    'lib/jszip.min.js',
+    'lib/cytoscape.min.js',
+    'lib/xpress9-glue.js',
+    'lib/xpress9.wasm.b64',
+    'lib/hyparquet-writer.min.js',
+    'scripts/build.py',
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_cached(path, mtime_ns, size):
+    with open(path, 'rb') as f:
         return f.read()
 
 
-def build(output_path=None):
+def _sha256_stream(f):
+    """Hash an open binary file in 1 MiB chunks, without holding it in memory."""
+    h = hashlib.sha256()
+    for chunk in iter(lambda: f.read(1 << 20), b''):
+        h.update(chunk)
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=32)
+def _sha256_cached(path, mtime_ns, size):
+    # Only the digest is cached; the bytes cache is for inlined sources
+    with open(path, 'rb') as f:
+        return _sha256_stream(f)
+
+
+def read_bytes(rel_path):
+    """Read a file relative to project root as raw bytes.
+
+    Contents are memoized on (path, mtime, size), so repeated build() calls in
+    one process (e.g. a test session) only re-read files that changed.
+    """
+    path = os.path.join(ROOT, rel_path)
+    st = os.stat(path)
+    return _read_cached(path, st.st_mtime_ns, st.st_size)
+
+
+def copy_file(dst, rel_path):
+    """Append a file relative to project root to an open binary output."""
+    path = os.path.join(ROOT, rel_path)
+    with open(path, 'rb') as src:
+        if hasattr(os, 'sendfile'):
+            dst.flush()
+            size = os.fstat(src.fileno()).st_size
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                pass  # Not supported for this pair of files (e.g. macOS)
+            # Resync both files with the positions sendfile left behind, then
+            # copy whatever is left (normally nothing)
+            src.seek(offset)
+            dst.seek(0, os.SEEK_END)
+        shutil.copyfileobj(src, dst, 1 << 20)
+
+
+def write_chunk(f, chunk):
+    """Write bytes, or a tuple of bytes, to an open binary output."""
+    if isinstance(chunk, tuple):
+        f.writelines(chunk)
+    else:
+        f.write(chunk)
+
+
+def sha256_file(path):
+    """Return the hex SHA-256 of a file, or None if it does not exist."""
+    try:
+        with open(path, 'rb') as f:
+            return _sha256_stream(f)
+    except FileNotFoundError:
+        return None
+
+
+def inputs_digest():
+    """Hash the contents of every build input, in a fixed order."""
+    h = hashlib.sha256()
+    for rel_path in INPUT_FILES:
+        path = os.path.join(ROOT, rel_path)
+        try:
+            st = os.stat(path)
+            file_hash = _sha256_cached(path, st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            file_hash = '-'
+        h.update(rel_path.encode('utf-8'))
+        h.update(b'\0')
+        h.update(file_hash.encode('ascii'))
+        h.update(b'\n')
+    return h.hexdigest()
+
+
+def manifest_path(output_path):
+    return os.path.join(os.path.dirname(os.path.abspath(output_path)), CACHE_DIR, 'manifest.json')
+
+
+def load_manifest(output_path):
+    try:
+        with open(manifest_path(output_path), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_manifest(output_path, manifest):
+    path = manifest_path(output_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+
+def build(output_path=None, force=False):
     if output_path is None:
         output_path = os.path.join(ROOT, 'index.html')
 
-    # Read template
-    template = read_file('src/template.html')
+    # Skip the build if neither the inputs nor the previous output changed
+    digest = inputs_digest()
+    manifest = load_manifest(output_path)
+    entry = manifest.get(os.path.basename(output_path), {})
+    if (not force and entry.get('inputs') == digest
+            and entry.get('output') == sha256_file(output_path)):
+        print(f'{output_path} is up to date')
+        return 0
+
+    # Read all inputs concurrently; they are independent blocking reads
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        template_f = ex.submit(read_bytes, 'src/template.html')
+        styles_f = ex.submit(read_bytes, 'src/styles.css')
+        app_js_f = ex.submit(read_bytes, 'src/app.js')
+        vertipaq_js_f = ex.submit(read_bytes, 'src/vertipaq.js')
+        export_js_f = ex.submit(read_bytes, 'src/export.js')
+        xpress9_wasm_b64_f = ex.submit(read_bytes, 'lib/xpress9.wasm.b64')
 
-    # Read source files
-    styles = read_file('src/styles.css')
-    app_js = read_file('src/app.js')
+    template = template_f.result()
+    styles = styles_f.result()
+    app_js = app_js_f.result()
 
     # VertiPaq and export are optional (might not exist yet during initial development)
     try:
-        vertipaq_js = read_file('src/vertipaq.js')
+        vertipaq_js = vertipaq_js_f.result()
     except FileNotFoundError:
-        vertipaq_js = '// VertiPaq decoder not yet implemented'
+        vertipaq_js = b'// VertiPaq decoder not yet implemented'
         print('  Warning: src/vertipaq.js not found, using stub')
 
     try:
-        export_js = read_file('src/export.js')
+        export_js = export_js_f.result()
     except FileNotFoundError:
-        export_js = '// Export module not yet implemented'
+        export_js = b'// Export module not yet implemented'
         print('  Warning: src/export.js not found, using stub')
 
-    # Read libraries
-    jszip = read_file('lib/jszip.min.js')
-    cytoscape = read_file('lib/cytoscape.min.js')
-    xpress9_glue = read_file('lib/xpress9-glue.js')
-    xpress9_wasm_b64 = read_file('lib/xpress9.wasm.b64').strip()
-    hyparquet_writer = read_file('lib/hyparquet-writer.min.js')
+    xpress9_wasm_b64 = xpress9_wasm_b64_f.result().strip()
 
-    # Inject WASM base64 into vertipaq.js
-    vertipaq_js = vertipaq_js.replace('%%XPRESS9_WASM_B64%%', xpress9_wasm_b64)
+    # Inject WASM base64 into vertipaq.js by writing it between the two halves
+    # of the module, rather than copying both into a new string
+    vertipaq_pre, marker, vertipaq_post = vertipaq_js.partition(WASM_B64_MARKER)
+    if marker:
+        vertipaq_js = (vertipaq_pre, xpress9_wasm_b64, vertipaq_post)
 
-    # Assemble HTML
+    parts = {
+        'STYLES': styles,
+        'APP_JS': app_js,
+        'VERTIPAQ_JS': vertipaq_js,
+        'EXPORT_JS': export_js,
+    }
+
+    # Check placeholders up front so a bad template never leaves a partial file.
+    # Names are interned once so the dict lookups below hit the fast path.
+    matches = [(m.start(), m.end(), sys.intern(m.group(1).decode('ascii')))
+               for m in PLACEHOLDER_RE.finditer(template)]
+    for _, _, name in matches:
+        if name not in parts and name not in LIBRARY_FILES:
+            print(f'  ERROR: Unresolved placeholder: {{{{{name}}}}}', file=sys.stderr)
+            return 1
+
+    # Stream template segments and substitutions straight to the output file.
     # IMPORTANT: Use string concatenation, NOT template literals / f-strings
     # with library content, because minified JS may contain curly braces.
-    html = template
-    html = html.replace('{{STYLES}}', styles)
-    html = html.replace('{{APP_JS}}', app_js)
-    html = html.replace('{{VERTIPAQ_JS}}', vertipaq_js)
-    html = html.replace('{{EXPORT_JS}}', export_js)
-    html = html.replace('{{JSZIP}}', jszip)
-    html = html.replace('{{CYTOSCAPE}}', cytoscape)
-    html = html.replace('{{XPRESS9_GLUE}}', xpress9_glue)
-    html = html.replace('{{HYPARQUET_WRITER}}', hyparquet_writer)
-
-    # Write output
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
-
-    size_kb = os.path.getsize(output_path) / 1024
-    print(f'Built {output_path} ({size_kb:.1f} KB)')
-
-    # Verify no unresolved placeholders remain
-    import re
-    remaining = re.findall(r'\{\{[A-Z_]+\}\}', html)
-    if remaining:
-        print(f'  WARNING: Unresolved placeholders: {remaining}', file=sys.stderr)
-        return 1
+    with open(output_path, 'wb', buffering=1 << 20) as f:
+        pos = 0
+        for start, end, name in matches:
+            write_chunk(f, template[pos:start])
+            if name in LIBRARY_FILES:
+                copy_file(f, LIBRARY_FILES[name])
+            else:
+                write_chunk(f, parts[name])
+            pos = end
+        write_chunk(f, template[pos:])
+        size = f.tell()
+
+    print(f'Built {output_path} ({size / 1024:.1f} KB)')
+
+    manifest[os.path.basename(output_path)] = {
+        'inputs': digest,
+        'output': sha256_file(output_path),
+    }
+    save_manifest(output_path, manifest)
 
     return 0
 
@@ -104,5 +268,6 @@ def build(output_path=None):
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Build Semantic Model Explorer HTML')
     parser.add_argument('--output', '-o', help='Output file path')
+    parser.add_argument('--force', '-f', action='store_true', help='Rebuild even if inputs are unchanged')
     args = parser.parse_args()
-    sys.exit(build(args.output))
+    sys.exit(build(args.output, force=args.force))
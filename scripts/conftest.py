@@ -4,14 +4,32 @@ import pytest
 from playwright.sync_api import BrowserType, Browser, BrowserContext, Page
 
 
+# No --single-process: the browser is shared for the whole session and
+# contexts are opened and closed on it concurrently, which that mode does
+# not support reliably.
 BROWSER_ARGS = [
     "--no-sandbox",
     "--disable-gpu",
     "--disable-dev-shm-usage",
-    "--single-process",
+    # Nothing in the app needs these; skipping them shortens cold start.
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-extensions",
+    "--no-first-run",
 ]
 
 
+# Injected into every test page: CSS transitions and animations only delay
+# Playwright's actionability checks, so switch them off.
+NO_ANIMATIONS_SCRIPT = """
+document.addEventListener('DOMContentLoaded', () => {
+    const style = document.createElement('style');
+    style.textContent = '*, *::before, *::after { animation: none !important; transition: none !important; }';
+    document.head.appendChild(style);
+});
+"""
+
+
 @pytest.fixture(scope="session")
 def browser_type_launch_args(browser_type_launch_args):
     """Add required browser launch args for this environment."""
@@ -21,14 +39,30 @@ def browser_type_launch_args(browser_type_launch_args):
     }
 
 
+@pytest.fixture(scope="session")
+def browser(browser_type: BrowserType, browser_type_launch_args) -> Browser:
+    """Launch one browser for the whole session."""
+    b = browser_type.launch(**browser_type_launch_args)
+    yield b
+    b.close()
+
+
+@pytest.fixture(scope="session")
+def make_context(browser: Browser):
+    """Return a factory for new contexts on the shared browser."""
+    def factory() -> BrowserContext:
+        ctx = browser.new_context()
+        ctx.add_init_script(NO_ANIMATIONS_SCRIPT)
+        return ctx
+    return factory
+
+
 @pytest.fixture
-def context(browser_type: BrowserType, browser_type_launch_args):
-    """Create a fresh browser + context per test (needed for --single-process)."""
-    browser = browser_type.launch(**browser_type_launch_args)
-    ctx = browser.new_context()
+def context(make_context):
+    """Create a fresh context per test on the shared browser."""
+    ctx = make_context()
     yield ctx
     ctx.close()
-    browser.close()
 
 
 @pytest.fixture
@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
-"""Debug script to inspect SQLite table schemas in a .pbix DataModel."""
+"""Debug script to inspect SQLite table schemas in a .pbix DataModel.
+
+Set PLAYWRIGHT_CDP to the endpoint printed by debug_pbix_daemon.py to reuse a
+long-running browser instead of launching Chromium on every run.
+"""
 
 import os, sys
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -8,19 +12,43 @@ from playwright.sync_api import sync_playwright
 HTML_PATH = os.path.join(ROOT, 'semantic-model-explorer.html')
 PBIX_PATH = os.path.join(ROOT, 'data', 'test-files', 'Revenue_Opportunities.pbix')
 
-BROWSER_ARGS = ["--no-sandbox", "--disable-gpu", "--disable-dev-shm-usage", "--single-process"]
+# Metadata tables whose CREATE TABLE statements are printed
+SCHEMA_TABLES = [
+    'Table', 'Column', 'ColumnStorage', 'ColumnPartitionStorage',
+    'DictionaryStorage', 'StorageFile', 'AttributeHierarchy',
+    'AttributeHierarchyStorage',
+]
+
+# Kept in step with debug_pbix_daemon.py, so a local launch and an attached
+# daemon run the same browser configuration (no --single-process).
+BROWSER_ARGS = ["--no-sandbox", "--disable-gpu", "--disable-dev-shm-usage"]
+CDP_ENDPOINT = os.environ.get('PLAYWRIGHT_CDP')
 
 with sync_playwright() as p:
-    browser = p.chromium.launch(args=BROWSER_ARGS)
-    page = browser.new_page()
+    if CDP_ENDPOINT:
+        browser = p.chromium.connect_over_cdp(CDP_ENDPOINT)
+        context = browser.contexts[0] if browser.contexts else browser.new_context()
+    else:
+        browser = p.chromium.launch(args=BROWSER_ARGS)
+        context = browser.new_context()
+    page = context.new_page()
     page.goto(f'file://{HTML_PATH}')
     page.wait_for_load_state('domcontentloaded')
 
-    with open(PBIX_PATH, 'rb') as f:
-        pbix_bytes = f.read()
+    # Hand the file to a scratch <input type=file> so the browser reads it from
+    # disk, rather than serializing every byte through page.evaluate. (The
+    # page CSP blocks fetch(), so a routed URL is not an option.)
+    page.evaluate('''() => {
+        const input = document.createElement("input");
+        input.type = "file";
+        input.id = "debugPbixInput";
+        input.style.display = "none";
+        document.body.appendChild(input);
+    }''')
+    page.set_input_files('#debugPbixInput', PBIX_PATH)
 
-    result = page.evaluate('''async (bytesArray) => {
-        const buf = new Uint8Array(bytesArray).buffer;
+    result = page.evaluate('''async (wanted) => {
+        const buf = await document.getElementById("debugPbixInput").files[0].arrayBuffer();
         const zip = await JSZip.loadAsync(buf);
         const dmFile = zip.file("DataModel");
         const dmBuf = await dmFile.async("arraybuffer");
@@ -37,8 +65,10 @@ with sync_playwright() as p:
 
         function getPage(num) { return dbBuf.subarray((num - 1) * pageSize, num * pageSize); }
         function readVarint(data, pos) {
-            let result = 0;
-            for (let i = 0; i < 8; i++) {
+            const b0 = data[pos];
+            if (b0 < 0x80) return { v: b0, n: 1 };
+            let result = b0 & 0x7f;
+            for (let i = 1; i < 8; i++) {
                 const b = data[pos + i];
                 result = result * 128 + (b & 0x7f);
                 if (!(b & 0x80)) return { v: result, n: i + 1 };
@@ -46,10 +76,9 @@ with sync_playwright() as p:
             result = result * 256 + data[pos + 8];
             return { v: result, n: 9 };
         }
-        function readBE(data, pos, len) {
-            let val = 0;
-            for (let i = 0; i < len; i++) val = val * 256 + data[pos + i];
-            return val;
+        // Big-endian u32 from a page (a subarray of dbBuf) via the shared DataView
+        function readU32(page, pos) {
+            return dv.getUint32(page.byteOffset - dbBuf.byteOffset + pos, false);
         }
         function readCellPayload(page, cellPtr) {
             const { v: payloadLen, n: n1 } = readVarint(page, cellPtr);
@@ -66,11 +95,11 @@ with sync_playwright() as p:
             const payload = new Uint8Array(payloadLen);
             payload.set(page.subarray(hdrStart, hdrStart + Math.min(localSize, payloadLen)));
             if (localSize < payloadLen) {
-                let op = readBE(page, hdrStart + localSize, 4);
+                let op = readU32(page, hdrStart + localSize);
                 let written = localSize;
                 while (op !== 0 && written < payloadLen) {
                     const oPage = getPage(op);
-                    op = readBE(oPage, 0, 4);
+                    op = readU32(oPage, 0);
                     const avail = Math.min(usableSize - 4, payloadLen - written);
                     payload.set(oPage.subarray(4, 4 + avail), written);
                     written += avail;
@@ -88,20 +117,21 @@ with sync_playwright() as p:
                 pos += sn;
             }
             const values = [];
+            const pdv = new DataView(payload.buffer, payload.byteOffset, payload.byteLength);
             let dPos = headerLen;
             for (const st of types) {
                 if (st === 0) { values.push(null); }
                 else if (st >= 1 && st <= 6) {
-                    const lens = [0, 1, 2, 3, 4, 6, 8];
-                    const len = lens[st];
-                    let val = 0;
-                    for (let i = 0; i < len; i++) val = val * 256 + payload[dPos + i];
-                    if (len > 0 && payload[dPos] & 0x80) val -= (1 << (len * 8));
-                    values.push(val);
-                    dPos += len;
+                    switch (st) {
+                        case 1: values.push(pdv.getInt8(dPos)); dPos += 1; break;
+                        case 2: values.push(pdv.getInt16(dPos, false)); dPos += 2; break;
+                        case 3: values.push((pdv.getInt8(dPos) << 16) | pdv.getUint16(dPos + 1, false)); dPos += 3; break;
+                        case 4: values.push(pdv.getInt32(dPos, false)); dPos += 4; break;
+                        case 5: values.push(pdv.getInt16(dPos, false) * 0x100000000 + pdv.getUint32(dPos + 2, false)); dPos += 6; break;
+                        case 6: values.push(Number(pdv.getBigInt64(dPos, false))); dPos += 8; break;
+                    }
                 } else if (st === 7) {
-                    const f64 = new DataView(payload.buffer, payload.byteOffset + dPos, 8).getFloat64(0, false);
-                    values.push(f64);
+                    values.push(pdv.getFloat64(dPos, false));
                     dPos += 8;
                 } else if (st === 8) { values.push(0); }
                 else if (st === 9) { values.push(1); }
@@ -132,10 +162,10 @@ with sync_playwright() as p:
                     }
                 } else if (pageType === 0x05) {
                     const numCells = (page[hdrOff + 3] << 8) | page[hdrOff + 4];
-                    const rightChild = readBE(page, hdrOff + 8, 4);
+                    const rightChild = readU32(page, hdrOff + 8);
                     for (let i = 0; i < numCells; i++) {
                         const cellPtr = (page[hdrOff + 12 + i*2] << 8) | page[hdrOff + 12 + i*2 + 1];
-                        traverse(readBE(page, cellPtr, 4));
+                        traverse(readU32(page, cellPtr));
                     }
                     traverse(rightChild);
                 }
@@ -146,10 +176,11 @@ with sync_playwright() as p:
 
         // Read sqlite_master
         const masterRows = readTable(1);
+        const wantedSet = new Set(wanted);
         const createSQLs = {};
         for (const row of masterRows) {
             const [type, name, tblName, rootpage, sql] = row.values;
-            if (type === "table" && sql) {
+            if (type === "table" && sql && wantedSet.has(name)) {
                 // Just get column names from CREATE TABLE
                 createSQLs[name] = sql.substring(0, 500);
             }
@@ -170,16 +201,16 @@ with sync_playwright() as p:
         }
 
         return { createSQLs, tableWithRowids };
-    }''', list(pbix_bytes))
+    }''', SCHEMA_TABLES)
 
     print("\nCREATE TABLE SQL statements:")
     for name, sql in result['createSQLs'].items():
-        if name in ('Table', 'Column', 'ColumnStorage', 'ColumnPartitionStorage',
-                     'DictionaryStorage', 'StorageFile', 'AttributeHierarchy',
-                     'AttributeHierarchyStorage'):
-            print(f"\n  {name}:")
-            print(f"    {sql}")
+        print(f"\n  {name}:")
+        print(f"    {sql}")
 
     print(f"\nTable rows with rowid: {result['tableWithRowids']}")
 
-    browser.close()
+    if CDP_ENDPOINT:
+        page.close()  # leave the shared browser running
+    else:
+        browser.close()
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""Launch a long-lived Chromium for repeated debug_pbix.py runs.
+
+Usage:
+    python scripts/debug_pbix_daemon.py                 # leave running
+    PLAYWRIGHT_CDP=http://127.0.0.1:9222 python scripts/debug_pbix.py
+"""
+
+import os
+import time
+
+from playwright.sync_api import sync_playwright
+
+# No --single-process: this browser serves a new page for every debug_pbix.py
+# run over its lifetime, which that mode does not handle reliably.
+BROWSER_ARGS = ["--no-sandbox", "--disable-gpu", "--disable-dev-shm-usage"]
+CDP_PORT = int(os.environ.get('CDP_PORT', '9222'))
+
+with sync_playwright() as p:
+    browser = p.chromium.launch(args=BROWSER_ARGS + [f"--remote-debugging-port={CDP_PORT}"])
+    print(f"PLAYWRIGHT_CDP=http://127.0.0.1:{CDP_PORT}", flush=True)
+    print("Press Ctrl+C to stop.")
+    try:
+        while browser.is_connected():
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    browser.close()
@@ -2,40 +2,59 @@
 """Extract the monolithic HTML into modular source files for the build system."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 HTML_PATH = os.path.join(ROOT, 'semantic-model-explorer.html')
 
-with open(HTML_PATH, 'r', encoding='utf-8') as f:
-    lines = f.readlines()
+with open(HTML_PATH, 'rb') as f:
+    data = f.read()
+
+# Byte offset of the start of every line, plus end-of-file
+line_offsets = [0]
+pos = data.find(b'\n')
+while pos >= 0:
+    line_offsets.append(pos + 1)
+    pos = data.find(b'\n', pos + 1)
+if line_offsets[-1] != len(data):
+    line_offsets.append(len(data))
+
+
+def lines(start, stop):
+    """Return 0-indexed lines [start, stop) of the HTML as raw bytes."""
+    last = len(line_offsets) - 1
+    return data[line_offsets[min(start, last)]:line_offsets[min(stop, last)]]
+
+
+def write_output(rel_path, content):
+    with open(os.path.join(ROOT, rel_path), 'wb') as f:
+        f.write(content)
+
+
+# Outputs are collected here and written together at the end
+outputs = {}
+
 
 # --- Extract CSS (lines 9-215, 1-indexed) ---
-css_lines = lines[8:215]  # 0-indexed: 8 to 214 inclusive
-css = ''.join(css_lines)
-with open(os.path.join(ROOT, 'src', 'styles.css'), 'w', encoding='utf-8') as f:
-    f.write(css)
+css = lines(8, 215)  # 0-indexed: 8 to 214 inclusive
+outputs['src/styles.css'] = css
 print(f"Extracted styles.css ({len(css)} bytes)")
 
 # --- Extract main app JS (lines 336-2261, 1-indexed) ---
-js_lines = lines[335:2261]  # 0-indexed: 335 to 2260 inclusive
-app_js = ''.join(js_lines)
-with open(os.path.join(ROOT, 'src', 'app.js'), 'w', encoding='utf-8') as f:
-    f.write(app_js)
+app_js = lines(335, 2261)  # 0-indexed: 335 to 2260 inclusive
+outputs['src/app.js'] = app_js
 print(f"Extracted app.js ({len(app_js)} bytes)")
 
 # --- Extract HTML body (lines 218-334, 1-indexed) ---
-body_lines = lines[217:334]  # 0-indexed: 217 to 333 inclusive
-body_html = ''.join(body_lines)
+body_html = lines(217, 334).decode('utf-8')  # 0-indexed: 217 to 333 inclusive
 
 # --- Extract JSZip (lines 2269-2284, 1-indexed) ---
 # Line 2269 is "<!-- JSZip v3.10.1 - bundled inline -->"
 # Line 2270 is "<script>"
 # Lines 2271-2283 are the JSZip source
 # Line 2284 is "</script>"
-jszip_lines = lines[2270:2283]  # 0-indexed: content lines
-jszip = ''.join(jszip_lines)
-with open(os.path.join(ROOT, 'lib', 'jszip.min.js'), 'w', encoding='utf-8') as f:
-    f.write(jszip)
+jszip = lines(2270, 2283)  # 0-indexed: content lines
+outputs['lib/jszip.min.js'] = jszip
 print(f"Extracted jszip.min.js ({len(jszip)} bytes)")
 
 # --- Extract Cytoscape (lines 2286-2321, 1-indexed) ---
@@ -43,10 +62,8 @@ print(f"Extracted jszip.min.js ({len(jszip)} bytes)")
 # Line 2287 is "<script>"
 # Lines 2288-2320 are the Cytoscape source
 # Line 2321 is "</script>"
-cyto_lines = lines[2287:2320]  # 0-indexed: content lines
-cyto = ''.join(cyto_lines)
-with open(os.path.join(ROOT, 'lib', 'cytoscape.min.js'), 'w', encoding='utf-8') as f:
-    f.write(cyto)
+cyto = lines(2287, 2320)  # 0-indexed: content lines
+outputs['lib/cytoscape.min.js'] = cyto
 print(f"Extracted cytoscape.min.js ({len(cyto)} bytes)")
 
 # --- Create template.html ---
@@ -107,8 +124,11 @@ template = '''<!DOCTYPE html>
 </html>
 '''
 
-with open(os.path.join(ROOT, 'src', 'template.html'), 'w', encoding='utf-8') as f:
-    f.write(template)
+outputs['src/template.html'] = template.encode('utf-8')
 print(f"Created template.html ({len(template)} bytes)")
 
+# The output files are independent, so write them concurrently
+with ThreadPoolExecutor(max_workers=len(outputs)) as ex:
+    list(ex.map(write_output, outputs.keys(), outputs.values()))
+
 print("\nDone! Source files extracted to src/ and lib/")
@@ -7,13 +7,72 @@ Creates:
 - .zip of TMDL folder
 """
 
+import functools
 import json
 import os
+import re
 import zipfile
 import io
-
-
-def make_test_model():
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
+
+
+# Placeholder M source shared by every table that has no real query. The
+# serializers only read it, so one instance is aliased everywhere instead of
+# a fresh literal per table.
+STUB_SOURCE = {"type": "m", "expression": "Source"}
+
+# Placeholder partition list for the edge-case models.
+STUB_PARTITIONS = [{"name": "p", "source": STUB_SOURCE}]
+
+
+def make_column(name, data_type, source_column, format_string=None, sort_by=None, hidden=False):
+    """Build a BIM data column dict, emitting optional keys only when set."""
+    column = {"name": name, "dataType": data_type, "sourceColumn": source_column}
+    if format_string:
+        column["formatString"] = format_string
+    if sort_by:
+        column["sortByColumn"] = sort_by
+    if hidden:
+        column["isHidden"] = True
+    return column
+
+
+def make_relationship(name, from_table, from_column, to_table, to_column, active=True, cross_filter=None):
+    """Build a many-to-one BIM relationship dict, emitting optional keys only when set."""
+    rel = {
+        "name": name,
+        "fromTable": from_table,
+        "fromColumn": from_column,
+        "toTable": to_table,
+        "toColumn": to_column,
+    }
+    if not active:
+        rel["isActive"] = False
+    rel["fromCardinality"] = "many"
+    rel["toCardinality"] = "one"
+    if cross_filter:
+        rel["crossFilteringBehavior"] = cross_filter
+    return rel
+
+
+def make_table(name, columns, measures=None, hidden=False, partitions=STUB_PARTITIONS):
+    """Build a BIM table dict, emitting optional keys only when set."""
+    table = {"name": name}
+    if hidden:
+        table["isHidden"] = True
+    table["columns"] = columns
+    if measures:
+        table["measures"] = measures
+    table["partitions"] = partitions
+    return table
+
+
+def _build_test_model():
     """Create a test semantic model as a BIM/TMSL JSON structure."""
     return {
         "name": "Test Sales Model",
@@ -24,11 +83,11 @@ def make_test_model():
                 {
                     "name": "Sales",
                     "columns": [
-                        {"name": "OrderID", "dataType": "int64", "sourceColumn": "OrderID"},
-                        {"name": "OrderDate", "dataType": "dateTime", "sourceColumn": "OrderDate", "formatString": "d/m/yyyy"},
-                        {"name": "Amount", "dataType": "decimal", "sourceColumn": "Amount", "formatString": "$#,##0"},
-                        {"name": "CustomerKey", "dataType": "int64", "sourceColumn": "CustomerKey", "isHidden": True},
-                        {"name": "ProductKey", "dataType": "int64", "sourceColumn": "ProductKey", "isHidden": True},
+                        make_column("OrderID", "int64", "OrderID"),
+                        make_column("OrderDate", "dateTime", "OrderDate", format_string="d/m/yyyy"),
+                        make_column("Amount", "decimal", "Amount", format_string="$#,##0"),
+                        make_column("CustomerKey", "int64", "CustomerKey", hidden=True),
+                        make_column("ProductKey", "int64", "ProductKey", hidden=True),
                         {
                             "name": "Margin",
                             "dataType": "decimal",
@@ -36,7 +95,7 @@ def make_test_model():
                             "expression": "Sales[Amount] - Sales[Cost]",
                             "formatString": "$#,##0",
                         },
-                        {"name": "Cost", "dataType": "decimal", "sourceColumn": "Cost", "isHidden": True},
+                        make_column("Cost", "decimal", "Cost", hidden=True),
                     ],
                     "measures": [
                         {
@@ -90,11 +149,11 @@ def make_test_model():
                 {
                     "name": "Date",
                     "columns": [
-                        {"name": "Date", "dataType": "dateTime", "sourceColumn": "Date", "formatString": "d/m/yyyy"},
-                        {"name": "Year", "dataType": "int64", "sourceColumn": "Year"},
-                        {"name": "Quarter", "dataType": "string", "sourceColumn": "Quarter"},
-                        {"name": "Month", "dataType": "string", "sourceColumn": "Month", "sortByColumn": "MonthNumber"},
-                        {"name": "MonthNumber", "dataType": "int64", "sourceColumn": "MonthNumber", "isHidden": True},
+                        make_column("Date", "dateTime", "Date", format_string="d/m/yyyy"),
+                        make_column("Year", "int64", "Year"),
+                        make_column("Quarter", "string", "Quarter"),
+                        make_column("Month", "string", "Month", sort_by="MonthNumber"),
+                        make_column("MonthNumber", "int64", "MonthNumber", hidden=True),
                     ],
                     "measures": [
                         {
@@ -126,11 +185,11 @@ def make_test_model():
                 {
                     "name": "Product",
                     "columns": [
-                        {"name": "ProductKey", "dataType": "int64", "sourceColumn": "ProductKey"},
-                        {"name": "Product Name", "dataType": "string", "sourceColumn": "ProductName"},
-                        {"name": "Category", "dataType": "string", "sourceColumn": "Category"},
-                        {"name": "Subcategory", "dataType": "string", "sourceColumn": "Subcategory"},
-                        {"name": "Unit Price", "dataType": "decimal", "sourceColumn": "UnitPrice", "formatString": "$#,##0.00"},
+                        make_column("ProductKey", "int64", "ProductKey"),
+                        make_column("Product Name", "string", "ProductName"),
+                        make_column("Category", "string", "Category"),
+                        make_column("Subcategory", "string", "Subcategory"),
+                        make_column("Unit Price", "decimal", "UnitPrice", format_string="$#,##0.00"),
                     ],
                     "hierarchies": [
                         {
@@ -142,67 +201,36 @@ def make_test_model():
                             ],
                         }
                     ],
-                    "partitions": [{"name": "Product", "source": {"type": "m", "expression": "Source"}}],
+                    "partitions": [{"name": "Product", "source": STUB_SOURCE}],
                 },
                 {
                     "name": "Customer",
                     "columns": [
-                        {"name": "CustomerKey", "dataType": "int64", "sourceColumn": "CustomerKey"},
-                        {"name": "Customer Name", "dataType": "string", "sourceColumn": "CustomerName"},
-                        {"name": "Region", "dataType": "string", "sourceColumn": "Region"},
-                        {"name": "Country", "dataType": "string", "sourceColumn": "Country"},
+                        make_column("CustomerKey", "int64", "CustomerKey"),
+                        make_column("Customer Name", "string", "CustomerName"),
+                        make_column("Region", "string", "Region"),
+                        make_column("Country", "string", "Country"),
                     ],
-                    "partitions": [{"name": "Customer", "source": {"type": "m", "expression": "Source"}}],
+                    "partitions": [{"name": "Customer", "source": STUB_SOURCE}],
                 },
                 {
                     "name": "Hidden Helper",
                     "isHidden": True,
                     "columns": [
-                        {"name": "ID", "dataType": "int64", "sourceColumn": "ID"},
-                        {"name": "Value", "dataType": "string", "sourceColumn": "Value"},
+                        make_column("ID", "int64", "ID"),
+                        make_column("Value", "string", "Value"),
                     ],
-                    "partitions": [{"name": "HiddenHelper", "source": {"type": "m", "expression": "Source"}}],
+                    "partitions": [{"name": "HiddenHelper", "source": STUB_SOURCE}],
                 },
             ],
             "relationships": [
-                {
-                    "name": "Sales_Product",
-                    "fromTable": "Sales",
-                    "fromColumn": "ProductKey",
-                    "toTable": "Product",
-                    "toColumn": "ProductKey",
-                    "fromCardinality": "many",
-                    "toCardinality": "one",
-                },
-                {
-                    "name": "Sales_Customer",
-                    "fromTable": "Sales",
-                    "fromColumn": "CustomerKey",
-                    "toTable": "Customer",
-                    "toColumn": "CustomerKey",
-                    "fromCardinality": "many",
-                    "toCardinality": "one",
-                },
-                {
-                    "name": "Sales_Date",
-                    "fromTable": "Sales",
-                    "fromColumn": "OrderDate",
-                    "toTable": "Date",
-                    "toColumn": "Date",
-                    "fromCardinality": "many",
-                    "toCardinality": "one",
-                },
-                {
-                    "name": "Sales_Date_Inactive",
-                    "fromTable": "Sales",
-                    "fromColumn": "OrderDate",
-                    "toTable": "Date",
-                    "toColumn": "Date",
-                    "isActive": False,
-                    "fromCardinality": "many",
-                    "toCardinality": "one",
-                    "crossFilteringBehavior": "bothDirections",
-                },
+                make_relationship("Sales_Product", "Sales", "ProductKey", "Product", "ProductKey"),
+                make_relationship("Sales_Customer", "Sales", "CustomerKey", "Customer", "CustomerKey"),
+                make_relationship("Sales_Date", "Sales", "OrderDate", "Date", "Date"),
+                make_relationship(
+                    "Sales_Date_Inactive", "Sales", "OrderDate", "Date", "Date",
+                    active=False, cross_filter="bothDirections",
+                ),
             ],
             "roles": [
                 {
@@ -223,48 +251,184 @@ def make_test_model():
     }
 
 
+# Built once at import; the model is only ever serialized, never mutated.
+_TEST_MODEL = _build_test_model()
+
+
+def make_test_model():
+    """Return the shared test model. Callers must not mutate it."""
+    return _TEST_MODEL
+
+
+def dumps_json(obj, indent=None):
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed.
+
+    Only indent=None (compact) and indent=2 are supported, matching orjson's
+    default and OPT_INDENT_2 output.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=indent, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def write_bytes(path, data):
+    """Write data to path with a single write() call. Returns the byte count.
+
+    The write is skipped when the file already holds exactly these bytes, so
+    regenerating unchanged fixtures costs a read instead of a rewrite.
+    Otherwise the data goes to a temp file that replaces path atomically, so
+    parallel test workers regenerating fixtures never read a partial file.
+    """
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return len(data)
+    except OSError:
+        pass  # missing or unreadable: just write it
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb", buffering=1 << 20) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave a stray temp file in the tracked fixture directory
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return len(data)
+
+
+def write_json(path, obj, indent=None):
+    """Serialize obj in one go and write it with a single write() call."""
+    return write_bytes(path, dumps_json(obj, indent=indent))
+
+
+@functools.lru_cache(maxsize=None)
+def model_json():
+    """Return the test model as indented JSON bytes, serialized once per run."""
+    return dumps_json(make_test_model(), indent=2)
+
+
 def generate_bim(output_dir):
     """Generate a .bim file."""
-    model = make_test_model()
     path = os.path.join(output_dir, "test-model.bim")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(model, f, indent=2)
-    print(f"Generated {path} ({os.path.getsize(path)} bytes)")
+    size = write_bytes(path, model_json())
+    print(f"Generated {path} ({size} bytes)")
     return path
 
 
+# Fixed member timestamp (the ZIP epoch) so regenerated archives are
+# byte-identical and write_bytes can skip them.
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def zip_member(name, compress_type=zipfile.ZIP_DEFLATED):
+    """Return a ZipInfo for name with a fixed timestamp and permissions."""
+    info = zipfile.ZipInfo(name, date_time=ZIP_DATE_TIME)
+    info.compress_type = compress_type
+    info.external_attr = 0o600 << 16  # what writestr() sets for a bare name
+    return info
+
+
 def generate_pbit(output_dir):
     """Generate a .pbit file (ZIP containing DataModelSchema as UTF-16LE)."""
-    model = make_test_model()
-    json_str = json.dumps(model, indent=2)
-    utf16_bytes = ("\ufeff" + json_str).encode("utf-16-le")
+    json_str = model_json().decode("utf-8")
+    utf16_bytes = b"\xff\xfe" + json_str.encode("utf-16-le")  # BOM + body
 
     path = os.path.join(output_dir, "test-model.pbit")
-    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr("DataModelSchema", utf16_bytes)
-        zf.writestr("Version", "2.0")
+    # Assemble the archive in memory and write it out in one call
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED, allowZip64=False) as zf:
+        zf.writestr(zip_member("DataModelSchema"), utf16_bytes, compresslevel=1)
+        # Tiny members gain nothing from deflate, so store them as-is
+        zf.writestr(zip_member("Version", zipfile.ZIP_STORED), "2.0")
         zf.writestr(
-            "[Content_Types].xml",
+            zip_member("[Content_Types].xml", zipfile.ZIP_STORED),
             '<?xml version="1.0" encoding="utf-8"?><Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types"><Default Extension="json" ContentType="application/json"/></Types>',
         )
-    print(f"Generated {path} ({os.path.getsize(path)} bytes)")
+    size = write_bytes(path, buf.getbuffer())
+    print(f"Generated {path} ({size} bytes)")
     return path
 
 
-def generate_tmdl(output_dir):
-    """Generate TMDL folder structure."""
-    tmdl_dir = os.path.join(output_dir, "tmdl-test-model", "definition")
-    tables_dir = os.path.join(tmdl_dir, "tables")
-    os.makedirs(tables_dir, exist_ok=True)
-
-    # database.tmdl
-    with open(os.path.join(tmdl_dir, "database.tmdl"), "w") as f:
-        f.write("compatibilityLevel: 1604\n")
-
-    # model.tmdl
-    with open(os.path.join(tmdl_dir, "model.tmdl"), "w") as f:
-        f.write(
-            """model Model
+# TMDL lineage tags for the test model's tables
+TMDL_LINEAGE_TAGS = {
+    "Sales": "test-sales-001",
+    "Date": "test-date-001",
+    "Product": "test-product-001",
+    "Customer": "test-customer-001",
+    "Hidden Helper": "test-hidden-001",
+}
+
+TMDL_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def tmdl_name(name):
+    """Quote a TMDL object name unless it is a plain identifier."""
+    if TMDL_IDENTIFIER_RE.match(name):
+        return name
+    return "'" + name.replace("'", "''") + "'"
+
+
+def tmdl_expression(expression, indent="\t\t\t"):
+    """Render the right-hand side of 'name = ...' for a DAX or M expression."""
+    if "\n" not in expression:
+        return f" {expression}\n"
+    return "\n" + "".join(f"{indent}{line}\n" for line in expression.split("\n"))
+
+
+def emit_table_tmdl(table, lineage_tag):
+    """Render one BIM table dict as a TMDL table file."""
+    parts = [f"table {tmdl_name(table['name'])}\n"]
+    if table.get("isHidden"):
+        parts.append("\tisHidden\n")
+    parts.append(f"\tlineageTag: {lineage_tag}\n")
+
+    for m in table.get("measures", []):
+        parts.append(f"\n\tmeasure {tmdl_name(m['name'])} ={tmdl_expression(m['expression'])}")
+        for key in ("formatString", "displayFolder", "description"):
+            if key in m:
+                parts.append(f"\t\t{key}: {m[key]}\n")
+        if m.get("isHidden"):
+            parts.append("\t\tisHidden\n")
+
+    for c in table.get("columns", []):
+        parts.append(f"\n\tcolumn {tmdl_name(c['name'])}\n")
+        parts.append(f"\t\tdataType: {c['dataType']}\n")
+        if "formatString" in c:
+            parts.append(f"\t\tformatString: {c['formatString']}\n")
+        if c.get("isHidden"):
+            parts.append("\t\tisHidden\n")
+        for key in ("sourceColumn", "sortByColumn"):
+            if key in c:
+                parts.append(f"\t\t{key}: {c[key]}\n")
+        if "expression" in c:
+            parts.append(f"\t\texpression ={tmdl_expression(c['expression'])}")
+
+    for h in table.get("hierarchies", []):
+        parts.append(f"\n\thierarchy {tmdl_name(h['name'])}\n")
+        for level in h["levels"]:
+            parts.append(f"\t\tlevel {tmdl_name(level['name'])}\n")
+
+    for partition in table.get("partitions", []):
+        source = partition["source"]
+        parts.append(f"\n\tpartition {tmdl_name(partition['name'])} = {source['type']}\n")
+        parts.append("\t\tmode: import\n")
+        parts.append(f"\t\tsource ={tmdl_expression(source['expression'])}")
+
+    return "".join(parts)
+
+
+# TMDL definition files for the test model, keyed by path under definition/.
+# Table files are rendered from the same model as the .bim and .pbit fixtures.
+TMDL_FILES = {
+    "database.tmdl": "compatibilityLevel: 1604\n",
+    "model.tmdl": """model Model
 \tculture: en-US
 \tdefaultPowerBIDataSourceVersion: powerBI_V3
 
@@ -276,13 +440,8 @@ ref table 'Hidden Helper'
 
 ref role 'Regional Manager'
 ref role Executive
-"""
-        )
-
-    # relationships.tmdl
-    with open(os.path.join(tmdl_dir, "relationships.tmdl"), "w") as f:
-        f.write(
-            """relationship Sales_Product
+""",
+    "relationships.tmdl": """relationship Sales_Product
 \tfromColumn: Sales.ProductKey
 \ttoColumn: Product.ProductKey
 
@@ -303,239 +462,73 @@ relationship Sales_Date_Inactive
 relationship Dotted_Table_Rel
 \tfromColumn: 'Schema.Sales'.ProductKey
 \ttoColumn: 'Schema.Product'.ProductKey
-"""
-        )
-
-    # tables/Sales.tmdl
-    with open(os.path.join(tables_dir, "Sales.tmdl"), "w") as f:
-        f.write(
-            """table Sales
-\tlineageTag: test-sales-001
-
-\tmeasure 'Total Sales' = SUM(Sales[Amount])
-\t\tformatString: $#,##0
-\t\tdisplayFolder: Revenue
-\t\tdescription: Total revenue from all transactions
-
-\tmeasure 'YoY Growth' =
-\t\t\tVAR CurrentYear = [Total Sales]
-\t\t\tVAR PriorYear = CALCULATE([Total Sales], SAMEPERIODLASTYEAR('Date'[Date]))
-\t\t\tRETURN DIVIDE(CurrentYear - PriorYear, PriorYear)
-\t\tformatString: 0.0%
-\t\tdisplayFolder: Revenue
-
-\tmeasure 'Order Count' = COUNTROWS(Sales)
-\t\tformatString: #,##0
-\t\tdisplayFolder: Counts
-
-\tmeasure 'Avg Order Value' = DIVIDE([Total Sales], [Order Count])
-\t\tformatString: $#,##0.00
-\t\tdisplayFolder: Revenue
-
-\tmeasure 'Total Cost' = SUM(Sales[Cost])
-\t\tformatString: $#,##0
-\t\tisHidden
-
-\tmeasure 'Margin %' = DIVIDE([Total Sales] - [Total Cost], [Total Sales])
-\t\tformatString: 0.0%
-\t\tdisplayFolder: Profitability
-
-\tcolumn OrderID
-\t\tdataType: int64
-\t\tsourceColumn: OrderID
-
-\tcolumn OrderDate
-\t\tdataType: dateTime
-\t\tformatString: d/m/yyyy
-\t\tsourceColumn: OrderDate
-
-\tcolumn Amount
-\t\tdataType: decimal
-\t\tformatString: $#,##0
-\t\tsourceColumn: Amount
-
-\tcolumn CustomerKey
-\t\tdataType: int64
-\t\tisHidden
-\t\tsourceColumn: CustomerKey
-
-\tcolumn ProductKey
-\t\tdataType: int64
-\t\tisHidden
-\t\tsourceColumn: ProductKey
-
-\tcolumn Margin
-\t\tdataType: decimal
-\t\tformatString: $#,##0
-\t\texpression = Sales[Amount] - Sales[Cost]
-
-\tcolumn Cost
-\t\tdataType: decimal
-\t\tisHidden
-\t\tsourceColumn: Cost
-
-\tpartition Sales = m
-\t\tmode: import
-\t\tsource =
-\t\t\tlet
-\t\t\t    Source = Sql.Database("server", "db"),
-\t\t\t    Sales = Source{[Schema="dbo",Item="Sales"]}[Data]
-\t\t\tin
-\t\t\t    Sales
-"""
-        )
-
-    # tables/Date.tmdl
-    with open(os.path.join(tables_dir, "Date.tmdl"), "w") as f:
-        f.write(
-            """table Date
-\tlineageTag: test-date-001
-
-\tmeasure 'Current Year' = YEAR(TODAY())
-\t\tformatString: 0
-
-\tcolumn Date
-\t\tdataType: dateTime
-\t\tformatString: d/m/yyyy
-\t\tsourceColumn: Date
-
-\tcolumn Year
-\t\tdataType: int64
-\t\tsourceColumn: Year
-
-\tcolumn Quarter
-\t\tdataType: string
-\t\tsourceColumn: Quarter
-
-\tcolumn Month
-\t\tdataType: string
-\t\tsourceColumn: Month
-\t\tsortByColumn: MonthNumber
-
-\tcolumn MonthNumber
-\t\tdataType: int64
-\t\tisHidden
-\t\tsourceColumn: MonthNumber
-
-\thierarchy 'Date Hierarchy'
-\t\tlevel Year
-\t\tlevel Quarter
-\t\tlevel Month
-
-\tpartition Date = m
-\t\tmode: import
-\t\tsource =
-\t\t\tlet
-\t\t\t    Source = List.Dates(#date(2020,1,1), 1461, #duration(1,0,0,0)),
-\t\t\t    Table = Table.FromList(Source)
-\t\t\tin
-\t\t\t    Table
-"""
-        )
-
-    # tables/Product.tmdl
-    with open(os.path.join(tables_dir, "Product.tmdl"), "w") as f:
-        f.write(
-            """table Product
-\tlineageTag: test-product-001
-
-\tcolumn ProductKey
-\t\tdataType: int64
-\t\tsourceColumn: ProductKey
-
-\tcolumn 'Product Name'
-\t\tdataType: string
-\t\tsourceColumn: ProductName
-
-\tcolumn Category
-\t\tdataType: string
-\t\tsourceColumn: Category
-
-\tcolumn Subcategory
-\t\tdataType: string
-\t\tsourceColumn: Subcategory
-
-\tcolumn 'Unit Price'
-\t\tdataType: decimal
-\t\tformatString: $#,##0.00
-\t\tsourceColumn: UnitPrice
-
-\thierarchy 'Product Hierarchy'
-\t\tlevel Category
-\t\tlevel Subcategory
-\t\tlevel 'Product Name'
-
-\tpartition Product = m
-\t\tmode: import
-\t\tsource = Source
-"""
-        )
-
-    # tables/Customer.tmdl
-    with open(os.path.join(tables_dir, "Customer.tmdl"), "w") as f:
-        f.write(
-            """table Customer
-\tlineageTag: test-customer-001
-
-\tcolumn CustomerKey
-\t\tdataType: int64
-\t\tsourceColumn: CustomerKey
-
-\tcolumn 'Customer Name'
-\t\tdataType: string
-\t\tsourceColumn: CustomerName
+""",
+    **{
+        f"tables/{t['name']}.tmdl": emit_table_tmdl(t, TMDL_LINEAGE_TAGS[t["name"]])
+        for t in _TEST_MODEL["model"]["tables"]
+    },
+}
 
-\tcolumn Region
-\t\tdataType: string
-\t\tsourceColumn: Region
+# Encoded once at import; generate_tmdl writes and zips these bytes as-is.
+TMDL_FILE_BYTES = {rel_path: content.encode("utf-8") for rel_path, content in TMDL_FILES.items()}
 
-\tcolumn Country
-\t\tdataType: string
-\t\tsourceColumn: Country
-
-\tpartition Customer = m
-\t\tmode: import
-\t\tsource = Source
-"""
-        )
 
-    # tables/Hidden Helper.tmdl
-    with open(os.path.join(tables_dir, "Hidden Helper.tmdl"), "w") as f:
-        f.write(
-            """table 'Hidden Helper'
-\tisHidden
-\tlineageTag: test-hidden-001
-
-\tcolumn ID
-\t\tdataType: int64
-\t\tsourceColumn: ID
+def generate_tmdl(output_dir):
+    """Generate TMDL folder structure."""
+    tmdl_dir = os.path.join(output_dir, "tmdl-test-model", "definition")
+    os.makedirs(os.path.join(tmdl_dir, "tables"), exist_ok=True)
 
-\tcolumn Value
-\t\tdataType: string
-\t\tsourceColumn: Value
-
-\tpartition HiddenHelper = m
-\t\tmode: import
-\t\tsource = Source
-"""
-        )
+    for rel_path, data in TMDL_FILE_BYTES.items():
+        write_bytes(os.path.join(tmdl_dir, rel_path), data)
 
     print(f"Generated TMDL folder at {tmdl_dir}")
 
-    # Also create a ZIP of the TMDL folder
+    # Also create a ZIP of the TMDL folder, from the same in-memory contents
     zip_path = os.path.join(output_dir, "tmdl-test-model.zip")
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        for root, dirs, files in os.walk(os.path.join(output_dir, "tmdl-test-model")):
-            for file in files:
-                abs_path = os.path.join(root, file)
-                arc_path = os.path.relpath(abs_path, output_dir)
-                zf.write(abs_path, arc_path)
-    print(f"Generated {zip_path} ({os.path.getsize(zip_path)} bytes)")
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED, compresslevel=1, allowZip64=False) as zf:
+        for rel_path, data in TMDL_FILE_BYTES.items():
+            zf.writestr(
+                zip_member(f"tmdl-test-model/definition/{rel_path}"), data, compresslevel=1
+            )
+    size = write_bytes(zip_path, buf.getbuffer())
+    print(f"Generated {zip_path} ({size} bytes)")
     return tmdl_dir, zip_path
 
 
-def generate_edge_case_files(output_dir):
-    """Generate edge case test files for comprehensive testing."""
+@functools.lru_cache(maxsize=None)
+def wide_model_json(n_tables, n_columns=5):
+    """Return a wide model (n_tables chained by relationships) as JSON bytes.
+
+    The JSON text is emitted straight from templates instead of building a
+    dict per table for the encoder to walk. All names are plain ASCII, so
+    nothing needs escaping.
+    """
+    columns = ",".join(
+        f'{{"name":"Col_{j}","dataType":"string","sourceColumn":"col{j}"}}'
+        for j in range(n_columns)
+    )
+    partitions = '[{"name":"p","source":{"type":"m","expression":"Source"}}]'
+    tables = ",".join(
+        f'{{"name":"Table_{i:03d}","columns":[{columns}],'
+        f'"measures":[{{"name":"M_{i}","expression":"COUNTROWS(Table_{i:03d})"}}],'
+        f'"partitions":{partitions}}}'
+        for i in range(n_tables)
+    )
+    relationships = ",".join(
+        f'{{"name":"r_{i}","fromTable":"Table_{i + 1:03d}","fromColumn":"Col_0",'
+        f'"toTable":"Table_{i:03d}","toColumn":"Col_0"}}'
+        for i in range(n_tables - 1)
+    )
+    return (
+        '{"name":"Wide Model","compatibilityLevel":1604,'
+        f'"model":{{"tables":[{tables}],"relationships":[{relationships}]}}}}'
+    ).encode("utf-8")
+
+
+def _build_edge_case_models():
+    """Create the edge-case models, keyed by output file name."""
+    models = {}
 
     # 1. Empty model (no tables)
     empty_model = {
@@ -543,10 +536,7 @@ def generate_edge_case_files(output_dir):
         "compatibilityLevel": 1604,
         "model": {"tables": []},
     }
-    path = os.path.join(output_dir, "edge-empty-model.bim")
-    with open(path, "w") as f:
-        json.dump(empty_model, f)
-    print(f"Generated {path}")
+    models["edge-empty-model.bim"] = empty_model
 
     # 2. Model with special characters in names
     special_model = {
@@ -554,16 +544,16 @@ def generate_edge_case_files(output_dir):
         "compatibilityLevel": 1604,
         "model": {
             "tables": [
-                {
-                    "name": "Table with Spaces & Symbols!",
-                    "columns": [
-                        {"name": "Column <html>", "dataType": "string", "sourceColumn": "x"},
-                        {"name": "Column \"quoted\"", "dataType": "int64", "sourceColumn": "y"},
-                        {"name": "Col|pipe|bar", "dataType": "string", "sourceColumn": "z"},
-                        {"name": "Col:colon:name", "dataType": "string", "sourceColumn": "w"},
-                        {"name": "Unicode\u00e9\u00e8\u00fc\u00f1", "dataType": "string", "sourceColumn": "u"},
+                make_table(
+                    "Table with Spaces & Symbols!",
+                    columns=[
+                        make_column("Column <html>", "string", "x"),
+                        make_column("Column \"quoted\"", "int64", "y"),
+                        make_column("Col|pipe|bar", "string", "z"),
+                        make_column("Col:colon:name", "string", "w"),
+                        make_column("Unicode\u00e9\u00e8\u00fc\u00f1", "string", "u"),
                     ],
-                    "measures": [
+                    measures=[
                         {
                             "name": "Measure with <script>alert(1)</script>",
                             "expression": "1+1",
@@ -573,15 +563,13 @@ def generate_edge_case_files(output_dir):
                             "expression": 'CALCULATE([Total], FILTER(\'Table with Spaces & Symbols!\'[Column <html>], TRUE()))',
                         },
                     ],
-                    "partitions": [{"name": "p", "source": {"type": "m", "expression": "Source"}}],
-                },
-                {
-                    "name": "Normal Table",
-                    "columns": [
-                        {"name": "ID", "dataType": "int64", "sourceColumn": "ID"},
+                ),
+                make_table(
+                    "Normal Table",
+                    columns=[
+                        make_column("ID", "int64", "ID"),
                     ],
-                    "partitions": [{"name": "p", "source": {"type": "m", "expression": "Source"}}],
-                },
+                ),
             ],
             "relationships": [
                 {
@@ -594,10 +582,7 @@ def generate_edge_case_files(output_dir):
             ],
         },
     }
-    path = os.path.join(output_dir, "edge-special-chars.bim")
-    with open(path, "w") as f:
-        json.dump(special_model, f)
-    print(f"Generated {path}")
+    models["edge-special-chars.bim"] = special_model
 
     # 3. Model with no measures
     no_measures = {
@@ -605,21 +590,17 @@ def generate_edge_case_files(output_dir):
         "compatibilityLevel": 1604,
         "model": {
             "tables": [
-                {
-                    "name": "Data",
-                    "columns": [
-                        {"name": "ID", "dataType": "int64", "sourceColumn": "ID"},
-                        {"name": "Name", "dataType": "string", "sourceColumn": "Name"},
+                make_table(
+                    "Data",
+                    columns=[
+                        make_column("ID", "int64", "ID"),
+                        make_column("Name", "string", "Name"),
                     ],
-                    "partitions": [{"name": "p", "source": {"type": "m", "expression": "Source"}}],
-                },
+                ),
             ],
         },
     }
-    path = os.path.join(output_dir, "edge-no-measures.bim")
-    with open(path, "w") as f:
-        json.dump(no_measures, f)
-    print(f"Generated {path}")
+    models["edge-no-measures.bim"] = no_measures
 
     # 4. Model with only hidden items
     hidden_model = {
@@ -627,24 +608,20 @@ def generate_edge_case_files(output_dir):
         "compatibilityLevel": 1604,
         "model": {
             "tables": [
-                {
-                    "name": "HiddenTable",
-                    "isHidden": True,
-                    "columns": [
-                        {"name": "HiddenCol", "dataType": "int64", "sourceColumn": "x", "isHidden": True},
+                make_table(
+                    "HiddenTable",
+                    hidden=True,
+                    columns=[
+                        make_column("HiddenCol", "int64", "x", hidden=True),
                     ],
-                    "measures": [
+                    measures=[
                         {"name": "HiddenMeasure", "expression": "1", "isHidden": True},
                     ],
-                    "partitions": [{"name": "p", "source": {"type": "m", "expression": "Source"}}],
-                },
+                ),
             ],
         },
     }
-    path = os.path.join(output_dir, "edge-all-hidden.bim")
-    with open(path, "w") as f:
-        json.dump(hidden_model, f)
-    print(f"Generated {path}")
+    models["edge-all-hidden.bim"] = hidden_model
 
     # 5. Single-table model (no relationships)
     single = {
@@ -652,85 +629,69 @@ def generate_edge_case_files(output_dir):
         "compatibilityLevel": 1604,
         "model": {
             "tables": [
-                {
-                    "name": "OnlyTable",
-                    "columns": [{"name": "Val", "dataType": "string", "sourceColumn": "Val"}],
-                    "measures": [{"name": "Count", "expression": "COUNTROWS(OnlyTable)"}],
-                    "partitions": [{"name": "p", "source": {"type": "m", "expression": "Source"}}],
-                },
+                make_table(
+                    "OnlyTable",
+                    columns=[make_column("Val", "string", "Val")],
+                    measures=[{"name": "Count", "expression": "COUNTROWS(OnlyTable)"}],
+                ),
             ],
         },
     }
-    path = os.path.join(output_dir, "edge-single-table.bim")
-    with open(path, "w") as f:
-        json.dump(single_model, f) if False else json.dump(single, f)
-    print(f"Generated {path}")
+    models["edge-single-table.bim"] = single
 
     # 6. Very long names
+    table_name, column_name, measure_name = "T" * 200, "C" * 200, "M" * 200
     long_model = {
         "name": "Long" * 50,
         "compatibilityLevel": 1604,
         "model": {
             "tables": [
-                {
-                    "name": "T" * 200,
-                    "columns": [
-                        {"name": "C" * 200, "dataType": "string", "sourceColumn": "x"},
+                make_table(
+                    table_name,
+                    columns=[
+                        make_column(column_name, "string", "x"),
                     ],
-                    "measures": [
-                        {"name": "M" * 200, "expression": "SUM(" + "T" * 200 + "[" + "C" * 200 + "])"},
+                    measures=[
+                        {"name": measure_name, "expression": f"SUM({table_name}[{column_name}])"},
                     ],
-                    "partitions": [{"name": "p", "source": {"type": "m", "expression": "Source"}}],
-                },
+                ),
             ],
         },
     }
-    path = os.path.join(output_dir, "edge-long-names.bim")
-    with open(path, "w") as f:
-        json.dump(long_model, f)
-    print(f"Generated {path}")
+    models["edge-long-names.bim"] = long_model
 
-    # 7. Many tables (wide model)
-    many_tables = {
-        "name": "Wide Model",
-        "compatibilityLevel": 1604,
-        "model": {
-            "tables": [
-                {
-                    "name": f"Table_{i:03d}",
-                    "columns": [
-                        {"name": f"Col_{j}", "dataType": "string", "sourceColumn": f"col{j}"}
-                        for j in range(5)
-                    ],
-                    "measures": [{"name": f"M_{i}", "expression": f"COUNTROWS(Table_{i:03d})"}],
-                    "partitions": [{"name": "p", "source": {"type": "m", "expression": "Source"}}],
-                }
-                for i in range(30)
-            ],
-            "relationships": [
-                {
-                    "name": f"r_{i}",
-                    "fromTable": f"Table_{i+1:03d}",
-                    "fromColumn": "Col_0",
-                    "toTable": f"Table_{i:03d}",
-                    "toColumn": "Col_0",
-                }
-                for i in range(29)
-            ],
-        },
-    }
+    return models
+
+
+# Built once at import, like the main test model; only ever serialized.
+EDGE_CASE_MODELS = _build_edge_case_models()
+
+
+def generate_edge_case_files(output_dir):
+    """Generate edge case test files for comprehensive testing."""
+    for file_name, model in EDGE_CASE_MODELS.items():
+        path = os.path.join(output_dir, file_name)
+        write_json(path, model)
+        print(f"Generated {path}")
+
+    # Many tables (wide model), emitted from templates
     path = os.path.join(output_dir, "edge-many-tables.bim")
-    with open(path, "w") as f:
-        json.dump(many_tables, f)
+    write_bytes(path, wide_model_json(30))
     print(f"Generated {path}")
 
 
+def generate_all(output_dir):
+    """Run every generator. They write disjoint files, so run them concurrently."""
+    generators = (generate_bim, generate_pbit, generate_tmdl, generate_edge_case_files)
+    with ThreadPoolExecutor(max_workers=len(generators)) as ex:
+        futures = [ex.submit(gen, output_dir) for gen in generators]
+    for future in futures:
+        future.result()  # re-raise any generator failure
+
+
 if __name__ == "__main__":
     output_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "test-files")
     os.makedirs(output_dir, exist_ok=True)
 
-    generate_bim(output_dir)
-    generate_pbit(output_dir)
-    generate_tmdl(output_dir)
-    generate_edge_case_files(output_dir)
+    generate_all(output_dir)
     print("\nAll test files generated successfully!")
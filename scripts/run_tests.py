@@ -5,8 +5,10 @@ using real and generated test files.
 
 Usage:
     uv run pytest scripts/run_tests.py -v
+    uv run pytest scripts/run_tests.py -n auto   # parallel, needs pytest-xdist
 """
 
+import base64
 import json
 import os
 import re
@@ -19,17 +21,64 @@ ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 HTML_PATH = os.path.join(ROOT, "index.html")
 TEST_FILES = os.path.join(ROOT, "data", "test-files")
 
+# Downloaded sample files are optional. Checking for them once at import lets
+# pytest skip their tests before any browser fixture is set up.
+HAS_ADVENTUREWORKS = os.path.exists(os.path.join(TEST_FILES, "AdventureWorks.bim"))
+HAS_ASPARTITION = os.path.exists(os.path.join(TEST_FILES, "AsPartitionProcessing.bim"))
+HAS_MDATP = os.path.exists(os.path.join(TEST_FILES, "MDATP_Status_Board.pbit"))
+HAS_TMDL_SALES = os.path.exists(os.path.join(TEST_FILES, "tmdl-sales.zip"))
+HAS_REVENUE_PBIX = os.path.exists(
+    os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
+)
+HAS_CORPORATE_SPEND = os.path.exists(os.path.join(TEST_FILES, "Corporate_Spend.pbix"))
+
+needs_adventureworks = pytest.mark.skipif(
+    not HAS_ADVENTUREWORKS, reason="AdventureWorks.bim not downloaded"
+)
+needs_aspartition = pytest.mark.skipif(
+    not HAS_ASPARTITION, reason="AsPartitionProcessing.bim not downloaded"
+)
+needs_mdatp = pytest.mark.skipif(
+    not HAS_MDATP, reason="MDATP_Status_Board.pbit not downloaded"
+)
+needs_tmdl_sales = pytest.mark.skipif(
+    not HAS_TMDL_SALES, reason="tmdl-sales.zip not downloaded"
+)
+needs_revenue_pbix = pytest.mark.skipif(
+    not HAS_REVENUE_PBIX, reason="Revenue_Opportunities.pbix not available"
+)
+needs_corporate_spend = pytest.mark.skipif(
+    not HAS_CORPORATE_SPEND, reason="Corporate_Spend.pbix not available"
+)
+
 
 @pytest.fixture(scope="session", autouse=True)
 def generate_test_files():
-    """Generate test files before running tests."""
-    from generate_test_files import generate_bim, generate_pbit, generate_tmdl, generate_edge_case_files
+    """Generate test files before running tests.
+
+    Regenerating is a few milliseconds and leaves unchanged files untouched,
+    so it always runs rather than trusting mtimes of checked-in fixtures.
+    """
+    from generate_test_files import generate_all
 
     os.makedirs(TEST_FILES, exist_ok=True)
-    generate_bim(TEST_FILES)
-    generate_pbit(TEST_FILES)
-    generate_tmdl(TEST_FILES)
-    generate_edge_case_files(TEST_FILES)
+    generate_all(TEST_FILES)
+
+
+@pytest.fixture(scope="session")
+def invalid_file(tmp_path_factory):
+    """A plain-text file that is not any Power BI format."""
+    path = tmp_path_factory.mktemp("bad-files") / "invalid.txt"
+    path.write_text("This is not a Power BI file")
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def empty_bim_file(tmp_path_factory):
+    """A .bim file containing only an empty JSON object."""
+    path = tmp_path_factory.mktemp("bad-files") / "empty.bim"
+    path.write_text("{}")
+    return str(path)
 
 
 @pytest.fixture
@@ -40,24 +89,122 @@ def app(page: Page):
     return page
 
 
+def open_app(make_context):
+    """Open the app on a new page of its own context. Returns (context, page)."""
+    context = make_context()
+    page = context.new_page()
+    page.goto(f"file://{HTML_PATH}")
+    page.wait_for_selector("#dropZone", state="visible", timeout=10000)
+    return context, page
+
+
+@pytest.fixture(scope="class")
+def shared_app(make_context):
+    """App page with no model loaded, shared by a class of pure-function tests."""
+    context, page = open_app(make_context)
+    yield page
+    context.close()
+
+
+def open_loaded_app(make_context, file_name: str, timeout: int = 15000):
+    """Open a new page with file_name loaded. Returns (context, page).
+
+    Used by class-scoped fixtures, so each large downloaded model is parsed
+    once per test class instead of once per test.
+    """
+    file_path = os.path.join(TEST_FILES, file_name)
+    context, page = open_app(make_context)
+    upload_file_via_input(page, file_path)
+    wait_for_app(page, timeout=timeout)
+    return context, page
+
+
+@pytest.fixture(scope="class")
+def adventureworks_app(make_context):
+    """AdventureWorks.bim loaded once for the requesting test class."""
+    context, page = open_loaded_app(make_context, "AdventureWorks.bim")
+    yield page
+    context.close()
+
+
+@pytest.fixture(scope="class")
+def aspartition_app(make_context):
+    """AsPartitionProcessing.bim loaded once for the requesting test class."""
+    context, page = open_loaded_app(make_context, "AsPartitionProcessing.bim")
+    yield page
+    context.close()
+
+
+@pytest.fixture(scope="class")
+def mdatp_app(make_context):
+    """MDATP_Status_Board.pbit loaded once for the requesting test class."""
+    context, page = open_loaded_app(make_context, "MDATP_Status_Board.pbit")
+    yield page
+    context.close()
+
+
+@pytest.fixture(scope="class")
+def tmdl_sales_app(make_context):
+    """The SamplePBIP TMDL zip loaded once for the requesting test class."""
+    context, page = open_loaded_app(make_context, "tmdl-sales.zip")
+    yield page
+    context.close()
+
+
+@pytest.fixture(scope="class")
+def revenue_pbix_app(make_context):
+    """Revenue_Opportunities.pbix loaded once for the requesting test class.
+
+    Only for tests that read state; tests that click through the UI or
+    change settings use the per-test app fixture.
+    """
+    context, page = open_loaded_app(
+        make_context, "Revenue_Opportunities.pbix", timeout=30000
+    )
+    yield page
+    context.close()
+
+
+@pytest.fixture(scope="class")
+def revenue_pbix_markdown(revenue_pbix_app):
+    """Markdown for the loaded .pbix, without and with the data profile.
+
+    computeAllStats scans every column of every table, so run it once per
+    class rather than once per Markdown test.
+    """
+    return revenue_pbix_app.evaluate("""async () => {
+        const statsMap = await computeAllStats(appState.model._pbixDataModel, () => {});
+        return {
+            plain: modelToMarkdown(appState.model, null),
+            withStats: modelToMarkdown(appState.model, null, statsMap),
+        };
+    }""")
+
+
 # ============================================================
 # Helper functions
 # ============================================================
 
 
 def drop_file(page: Page, file_path: str):
-    """Simulate dropping a file on the drop zone."""
+    """Simulate dropping a file on the drop zone.
+
+    The bytes are read here and handed to the page as base64: the app's CSP
+    (default-src 'none') blocks fetch(), and this skips a browser round-trip.
+    """
+    with open(file_path, "rb") as f:
+        data = base64.b64encode(f.read()).decode("ascii")
     page.evaluate(
-        """async (filePath) => {
-        const response = await fetch('file://' + filePath);
-        const buffer = await response.arrayBuffer();
-        const fileName = filePath.split('/').pop();
+        """([fileName, data]) => {
+        const bin = atob(data);
+        const bytes = new Uint8Array(bin.length);
+        for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
 
         // Determine MIME type
         let type = 'application/octet-stream';
         if (fileName.endsWith('.json') || fileName.endsWith('.bim')) type = 'application/json';
 
-        const file = new File([buffer], fileName, { type });
+        const file = new File([bytes], fileName, { type });
         const dt = new DataTransfer();
         dt.items.add(file);
 
@@ -65,7 +212,7 @@ def drop_file(page: Page, file_path: str):
         const event = new DragEvent('drop', { dataTransfer: dt, bubbles: true });
         dropZone.dispatchEvent(event);
     }""",
-        file_path,
+        [os.path.basename(file_path), data],
     )
 
 
@@ -79,6 +226,16 @@ def wait_for_app(page: Page, timeout: int = 15000):
     page.wait_for_selector("#appWrap", state="visible", timeout=timeout)
 
 
+def wait_for_diagram(page: Page, timeout: int = 10000):
+    """Wait for the Diagram tab to build its Cytoscape graph.
+
+    The graph is created on the animation frame after the tab switch and its
+    layout runs synchronously (animate: false), so it is ready once
+    appState.cy exists.
+    """
+    page.wait_for_function("() => !!appState.cy", timeout=timeout)
+
+
 def get_header_stats(page: Page) -> str:
     """Get the model stats text from the header."""
     return page.text_content("#modelStats")
@@ -119,6 +276,66 @@ def count_tree_items(page: Page, section: str = None) -> int:
     return len(items)
 
 
+def count_dax_blocks(page: Page) -> int:
+    """Count ```dax blocks in the full-model Markdown without transferring it."""
+    return page.evaluate(
+        "() => (modelToMarkdown(appState.model, null).match(/```dax/g) || []).length"
+    )
+
+
+def markdown_contains(page: Page, *needles: str) -> dict:
+    """Map each needle to whether the full-model Markdown contains it."""
+    return page.evaluate(
+        """(needles) => {
+            const md = modelToMarkdown(appState.model, null);
+            return Object.fromEntries(needles.map(n => [n, md.includes(n)]));
+        }""",
+        list(needles),
+    )
+
+
+def export_buttons_disabled(page: Page) -> dict:
+    """Read the disabled state of all four Data tab export buttons at once."""
+    return page.evaluate("""() => ({
+        csv: document.getElementById('exportCsvBtn').disabled,
+        parquet: document.getElementById('exportParquetBtn').disabled,
+        allCsv: document.getElementById('exportAllCsvBtn').disabled,
+        allParquet: document.getElementById('exportAllParquetBtn').disabled,
+    })""")
+
+
+def expect_tree_tables(page: Page, table_names):
+    """Assert each table has a visible item in the tree, matched by exact name."""
+    for name in table_names:
+        expect(
+            page.locator(f'#treeScroll .tree-item[data-key="table:{name}"]'),
+            f"Table '{name}' not found in tree",
+        ).to_be_visible()
+
+
+# ============================================================
+# Fixture Generator Tests
+# ============================================================
+
+
+class TestFixtureGeneration:
+    """Tests for scripts/generate_test_files.py itself."""
+
+    def test_regenerating_leaves_archives_untouched(self, tmp_path):
+        """Test that unchanged .pbit/.zip fixtures are not rewritten on a second run."""
+        from generate_test_files import generate_all
+
+        generate_all(str(tmp_path))
+        archives = [tmp_path / "test-model.pbit", tmp_path / "tmdl-test-model.zip"]
+        # Backdate the files so a rewrite is visible even on coarse-mtime filesystems
+        for path in archives:
+            os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+        generate_all(str(tmp_path))
+        for path in archives:
+            assert path.stat().st_mtime_ns == 1_000_000_000, f"{path.name} was rewritten"
+
+
 # ============================================================
 # BIM File Tests
 # ============================================================
@@ -140,12 +357,10 @@ class TestBimParsing:
         assert "7 Measures" in stats  # 6 in Sales + 1 in Date
         assert "4 Relationships" in stats
 
+    @needs_adventureworks
     def test_load_adventureworks_bim(self, app: Page):
         """Test loading the AdventureWorks .bim from TabularEditor."""
         bim_path = os.path.join(TEST_FILES, "AdventureWorks.bim")
-        if not os.path.exists(bim_path):
-            pytest.skip("AdventureWorks.bim not downloaded")
-
         upload_file_via_input(app, bim_path)
         wait_for_app(app)
 
@@ -154,12 +369,10 @@ class TestBimParsing:
         assert "67 Measures" in stats
         assert "27 Relationships" in stats
 
+    @needs_aspartition
     def test_load_aspartition_bim(self, app: Page):
         """Test loading the AsPartitionProcessing .bim from Microsoft."""
         bim_path = os.path.join(TEST_FILES, "AsPartitionProcessing.bim")
-        if not os.path.exists(bim_path):
-            pytest.skip("AsPartitionProcessing.bim not downloaded")
-
         upload_file_via_input(app, bim_path)
         wait_for_app(app)
 
@@ -197,12 +410,10 @@ class TestPbitParsing:
         assert "5 Tables" in stats
         assert "7 Measures" in stats
 
+    @needs_mdatp
     def test_load_mdatp_pbit(self, app: Page):
         """Test loading the Microsoft MDATP .pbit file."""
         pbit_path = os.path.join(TEST_FILES, "MDATP_Status_Board.pbit")
-        if not os.path.exists(pbit_path):
-            pytest.skip("MDATP_Status_Board.pbit not downloaded")
-
         upload_file_via_input(app, pbit_path)
         wait_for_app(app)
 
@@ -297,11 +508,9 @@ class TestUIInteractions:
 
         # Search for 'Sales'
         app.fill("#treeSearch", "Sales")
-        app.wait_for_timeout(300)  # Wait for filter to apply
 
         # Should still show Sales-related items
-        tree_text = app.text_content("#treeScroll")
-        assert "Sales" in tree_text
+        expect(app.locator("#treeScroll")).to_contain_text("Sales")
 
     def test_select_all_checkbox(self, app: Page):
         """Test Select All checkbox."""
@@ -310,11 +519,9 @@ class TestUIInteractions:
 
         # Click Select All
         app.check("#selectAll")
-        app.wait_for_timeout(200)
 
         # Token count should be > 0
-        token_text = app.text_content("#selectedTokenBadge")
-        assert "~0 tokens" not in token_text
+        expect(app.locator("#selectedTokenBadge")).not_to_contain_text("~0 tokens")
 
     def test_detail_panel_shows_on_click(self, app: Page):
         """Test that clicking a tree item shows details."""
@@ -322,14 +529,10 @@ class TestUIInteractions:
         wait_for_app(app)
 
         # Click the first tree item
-        items = app.query_selector_all(".tree-item")
-        if len(items) > 0:
-            items[0].click()
-            app.wait_for_timeout(200)
+        app.locator(".tree-item").first.click()
 
-            # Detail panel should not show the empty message
-            detail_text = app.text_content("#detailPanel")
-            assert "Select an item" not in detail_text
+        # Detail panel should not show the empty message
+        expect(app.locator("#detailPanel")).not_to_contain_text("Select an item")
 
     def test_copy_all_button(self, app: Page):
         """Test Copy All button produces output."""
@@ -393,7 +596,7 @@ class TestDiagram:
         wait_for_app(app)
 
         click_tab(app, "diagram")
-        app.wait_for_timeout(1000)  # Wait for Cytoscape to render
+        wait_for_diagram(app)
 
         # Check that the diagram container has content
         container = app.locator("#diagramContainer")
@@ -412,10 +615,9 @@ class TestDiagram:
         wait_for_app(app)
 
         click_tab(app, "diagram")
-        app.wait_for_timeout(1000)
+        wait_for_diagram(app)
 
         app.fill("#diagramSearch", "Product")
-        app.wait_for_timeout(300)
 
         # Product node should be visible (opacity 1), others dimmed
         opacity = app.evaluate("""() => {
@@ -434,34 +636,26 @@ class TestDiagram:
 class TestErrorHandling:
     """Tests for error handling."""
 
-    def test_invalid_file_shows_error(self, app: Page):
+    def test_invalid_file_shows_error(self, app: Page, invalid_file: str):
         """Test that dropping an invalid file shows an error."""
-        # Create a dummy invalid file
-        dummy_path = os.path.join(TEST_FILES, "invalid.txt")
-        with open(dummy_path, "w") as f:
-            f.write("This is not a Power BI file")
-
-        upload_file_via_input(app, dummy_path)
-        app.wait_for_timeout(2000)
+        upload_file_via_input(app, invalid_file)
 
         # Error banner should be visible
         error = app.locator("#errorBanner")
         expect(error).to_be_visible()
 
-    def test_empty_json_shows_error(self, app: Page):
+    def test_empty_json_shows_error(self, app: Page, empty_bim_file: str):
         """Test that an empty JSON file shows an error."""
-        dummy_path = os.path.join(TEST_FILES, "empty.bim")
-        with open(dummy_path, "w") as f:
-            f.write("{}")
-
-        upload_file_via_input(app, dummy_path)
-        app.wait_for_timeout(2000)
+        upload_file_via_input(app, empty_bim_file)
+        app.wait_for_selector("#appWrap:visible, #errorBanner:visible", timeout=5000)
 
         # Should still load (empty model) or show error
         # An empty model with 0 tables is acceptable
-        app_visible = app.evaluate("() => document.getElementById('appWrap').style.display !== 'none'")
-        error_visible = app.evaluate("() => document.getElementById('errorBanner').style.display !== 'none'")
-        assert app_visible or error_visible
+        state = app.evaluate("""() => ({
+            app: document.getElementById('appWrap').style.display !== 'none',
+            error: document.getElementById('errorBanner').style.display !== 'none',
+        })""")
+        assert state["app"] or state["error"]
 
 
 # ============================================================
@@ -481,7 +675,7 @@ class TestCrossFormatConsistency:
 
         # Return to drop zone
         app.click("#newFileBtn")
-        app.wait_for_timeout(500)
+        expect(app.locator("#dropZoneWrap")).to_be_visible()
 
         # Load PBIT
         upload_file_via_input(app, os.path.join(TEST_FILES, "test-model.pbit"))
@@ -503,7 +697,7 @@ class TestCrossFormatConsistency:
         bim_md = app.evaluate("() => modelToMarkdown(appState.model, null)")
 
         app.click("#newFileBtn")
-        app.wait_for_timeout(500)
+        expect(app.locator("#dropZoneWrap")).to_be_visible()
 
         # Load PBIT
         upload_file_via_input(app, os.path.join(TEST_FILES, "test-model.pbit"))
@@ -522,11 +716,14 @@ class TestCrossFormatConsistency:
 
 
 class TestParserInternals:
-    """Tests for parser internals via page.evaluate."""
+    """Tests for parser internals via page.evaluate.
 
-    def test_bim_json_parsing(self, app: Page):
+    These only call pure functions, so the whole class shares one page.
+    """
+
+    def test_bim_json_parsing(self, shared_app: Page):
         """Test that parseBimJson handles a minimal model."""
-        result = app.evaluate("""() => {
+        result = shared_app.evaluate("""() => {
             const json = {
                 name: "TestModel",
                 compatibilityLevel: 1600,
@@ -557,9 +754,9 @@ class TestParserInternals:
         assert result["colName"] == "ID"
         assert result["measExpr"] == "COUNTROWS(Fact)"
 
-    def test_rowNumber_columns_excluded(self, app: Page):
+    def test_rowNumber_columns_excluded(self, shared_app: Page):
         """Test that rowNumber columns are excluded from parsing."""
-        result = app.evaluate("""() => {
+        result = shared_app.evaluate("""() => {
             const json = {
                 name: "Test",
                 model: {
@@ -578,9 +775,9 @@ class TestParserInternals:
 
         assert result == 1  # Only ID, not RowNumber
 
-    def test_cardinality_mapping(self, app: Page):
+    def test_cardinality_mapping(self, shared_app: Page):
         """Test cardinality mapping function."""
-        result = app.evaluate("""() => {
+        result = shared_app.evaluate("""() => {
             return {
                 m2o: mapCardinality('many', 'one'),
                 o2m: mapCardinality('one', 'many'),
@@ -594,15 +791,15 @@ class TestParserInternals:
         assert result["o2o"] == "oneToOne"
         assert result["m2m"] == "manyToMany"
 
-    def test_token_estimation(self, app: Page):
+    def test_token_estimation(self, shared_app: Page):
         """Test token estimation function."""
-        result = app.evaluate("() => estimateTokens('Hello world, this is a test.')")
+        result = shared_app.evaluate("() => estimateTokens('Hello world, this is a test.')")
         # ~28 chars / 4 = ~7 tokens
         assert 5 <= result <= 10
 
-    def test_measure_render_decodes_html_entities(self, app: Page):
+    def test_measure_render_decodes_html_entities(self, shared_app: Page):
         """Test that encoded entities in DAX render as actual characters."""
-        result = app.evaluate("""() => {
+        result = shared_app.evaluate("""() => {
             const panel = document.createElement('div');
             renderMeasureDetail(
                 panel,
@@ -626,9 +823,9 @@ class TestParserInternals:
         assert "&#39;" not in result["text"], "Rendered text should not show literal quote entity codes"
         assert "'Calendar'" in result["text"], "Rendered text should show normal single quotes in DAX"
 
-    def test_markdown_output_structure(self, app: Page):
+    def test_markdown_output_structure(self, shared_app: Page):
         """Test that modelToMarkdown produces expected sections."""
-        result = app.evaluate("""() => {
+        result = shared_app.evaluate("""() => {
             const model = {
                 name: "Test", compatibilityLevel: 1600, culture: "en-US",
                 tables: [{
@@ -662,61 +859,34 @@ class TestParserInternals:
 class TestDownloadedFiles:
     """Deep tests for downloaded Power BI files from Microsoft/community repos."""
 
-    def test_adventureworks_table_details(self, app: Page):
+    @needs_adventureworks
+    def test_adventureworks_table_details(self, adventureworks_app: Page):
         """Test AdventureWorks has expected tables and measures."""
-        bim_path = os.path.join(TEST_FILES, "AdventureWorks.bim")
-        if not os.path.exists(bim_path):
-            pytest.skip("AdventureWorks.bim not downloaded")
-
-        upload_file_via_input(app, bim_path)
-        wait_for_app(app)
-
-        # Check specific tables exist in tree
-        tree_text = app.text_content("#treeScroll")
-        for table_name in ["Internet Sales", "Customer", "Product", "Date", "Geography"]:
-            assert table_name in tree_text, f"Table '{table_name}' not found in tree"
+        expect_tree_tables(
+            adventureworks_app,
+            ["Internet Sales", "Customer", "Product", "Date", "Geography"],
+        )
 
-    def test_adventureworks_measures_in_markdown(self, app: Page):
+    @needs_adventureworks
+    def test_adventureworks_measures_in_markdown(self, adventureworks_app: Page):
         """Test AdventureWorks measures are exported to Markdown correctly."""
-        bim_path = os.path.join(TEST_FILES, "AdventureWorks.bim")
-        if not os.path.exists(bim_path):
-            pytest.skip("AdventureWorks.bim not downloaded")
-
-        upload_file_via_input(app, bim_path)
-        wait_for_app(app)
-
-        md = app.evaluate("() => modelToMarkdown(appState.model, null)")
-        assert md is not None
-        assert "## Measures" in md
-        assert "```dax" in md
+        assert markdown_contains(adventureworks_app, "## Measures")["## Measures"]
         # AdventureWorks has 67 measures - verify DAX blocks
-        dax_count = md.count("```dax")
+        dax_count = count_dax_blocks(adventureworks_app)
         assert dax_count >= 60, f"Expected ~67 DAX blocks, got {dax_count}"
 
-    def test_adventureworks_relationships_in_markdown(self, app: Page):
+    @needs_adventureworks
+    def test_adventureworks_relationships_in_markdown(self, adventureworks_app: Page):
         """Test AdventureWorks relationship details in Markdown."""
-        bim_path = os.path.join(TEST_FILES, "AdventureWorks.bim")
-        if not os.path.exists(bim_path):
-            pytest.skip("AdventureWorks.bim not downloaded")
-
-        upload_file_via_input(app, bim_path)
-        wait_for_app(app)
-
-        md = app.evaluate("() => modelToMarkdown(appState.model, null)")
-        assert "## Relationships" in md
-        assert "Internet Sales" in md
-        assert "Customer" in md
+        found = markdown_contains(
+            adventureworks_app, "## Relationships", "Internet Sales", "Customer"
+        )
+        assert all(found.values()), f"Missing from Markdown: {found}"
 
-    def test_adventureworks_hierarchies(self, app: Page):
+    @needs_adventureworks
+    def test_adventureworks_hierarchies(self, adventureworks_app: Page):
         """Test that AdventureWorks hierarchies are parsed."""
-        bim_path = os.path.join(TEST_FILES, "AdventureWorks.bim")
-        if not os.path.exists(bim_path):
-            pytest.skip("AdventureWorks.bim not downloaded")
-
-        upload_file_via_input(app, bim_path)
-        wait_for_app(app)
-
-        result = app.evaluate("""() => {
+        result = adventureworks_app.evaluate("""() => {
             const tables = appState.model.tables;
             let totalHierarchies = 0;
             for (const t of tables) {
@@ -726,149 +896,91 @@ class TestDownloadedFiles:
         }""")
         assert result > 0, "Expected at least one hierarchy in AdventureWorks"
 
-    def test_adventureworks_roles(self, app: Page):
+    @needs_adventureworks
+    def test_adventureworks_roles(self, adventureworks_app: Page):
         """Test that AdventureWorks roles are parsed."""
-        bim_path = os.path.join(TEST_FILES, "AdventureWorks.bim")
-        if not os.path.exists(bim_path):
-            pytest.skip("AdventureWorks.bim not downloaded")
-
-        upload_file_via_input(app, bim_path)
-        wait_for_app(app)
+        assert markdown_contains(adventureworks_app, "## Roles")["## Roles"]
+        assert "4 Roles" in get_header_stats(adventureworks_app)
 
-        md = app.evaluate("() => modelToMarkdown(appState.model, null)")
-        assert "## Roles" in md
-        assert "4 Roles" in get_header_stats(app)
-
-    def test_adventureworks_diagram(self, app: Page):
+    @needs_adventureworks
+    def test_adventureworks_diagram(self, adventureworks_app: Page):
         """Test AdventureWorks renders in diagram with correct node count."""
-        bim_path = os.path.join(TEST_FILES, "AdventureWorks.bim")
-        if not os.path.exists(bim_path):
-            pytest.skip("AdventureWorks.bim not downloaded")
-
-        upload_file_via_input(app, bim_path)
-        wait_for_app(app)
-
-        click_tab(app, "diagram")
-        app.wait_for_timeout(1000)
+        # The page is shared with the tree tests, so always switch back to
+        # the Model tab whatever order the tests run in.
+        click_tab(adventureworks_app, "diagram")
+        try:
+            wait_for_diagram(adventureworks_app)
+            node_count = adventureworks_app.evaluate("""() => {
+                if (!appState.cy) return 0;
+                return appState.cy.nodes().length;
+            }""")
+        finally:
+            click_tab(adventureworks_app, "model")
 
-        node_count = app.evaluate("""() => {
-            if (!appState.cy) return 0;
-            return appState.cy.nodes().length;
-        }""")
         # Should have nodes for visible tables
         assert node_count >= 10, f"Expected >=10 diagram nodes, got {node_count}"
 
-    def test_aspartition_specific_tables(self, app: Page):
+    @needs_aspartition
+    def test_aspartition_specific_tables(self, aspartition_app: Page):
         """Test AsPartitionProcessing has expected tables."""
-        bim_path = os.path.join(TEST_FILES, "AsPartitionProcessing.bim")
-        if not os.path.exists(bim_path):
-            pytest.skip("AsPartitionProcessing.bim not downloaded")
-
-        upload_file_via_input(app, bim_path)
-        wait_for_app(app)
-
-        tree_text = app.text_content("#treeScroll")
-        for table_name in ["Internet Sales", "Customer", "Product", "Date"]:
-            assert table_name in tree_text, f"Table '{table_name}' not found"
+        expect_tree_tables(
+            aspartition_app, ["Internet Sales", "Customer", "Product", "Date"]
+        )
 
-    def test_aspartition_measures(self, app: Page):
+    @needs_aspartition
+    def test_aspartition_measures(self, aspartition_app: Page):
         """Test AsPartitionProcessing measures in Markdown."""
-        bim_path = os.path.join(TEST_FILES, "AsPartitionProcessing.bim")
-        if not os.path.exists(bim_path):
-            pytest.skip("AsPartitionProcessing.bim not downloaded")
-
-        upload_file_via_input(app, bim_path)
-        wait_for_app(app)
-
-        md = app.evaluate("() => modelToMarkdown(appState.model, null)")
-        dax_count = md.count("```dax")
+        dax_count = count_dax_blocks(aspartition_app)
         assert dax_count >= 18, f"Expected ~21 DAX blocks, got {dax_count}"
 
-    def test_mdatp_specific_tables(self, app: Page):
+    @needs_mdatp
+    def test_mdatp_specific_tables(self, mdatp_app: Page):
         """Test MDATP PBIT has expected tables."""
-        pbit_path = os.path.join(TEST_FILES, "MDATP_Status_Board.pbit")
-        if not os.path.exists(pbit_path):
-            pytest.skip("MDATP_Status_Board.pbit not downloaded")
-
-        upload_file_via_input(app, pbit_path)
-        wait_for_app(app)
-
-        tree_text = app.text_content("#treeScroll")
-        for table_name in ["Devices", "Alerts", "Vulnerabilities"]:
-            assert table_name in tree_text, f"Table '{table_name}' not found"
+        expect_tree_tables(mdatp_app, ["Devices", "Alerts", "Vulnerabilities"])
 
-    def test_mdatp_measures_in_markdown(self, app: Page):
+    @needs_mdatp
+    def test_mdatp_measures_in_markdown(self, mdatp_app: Page):
         """Test MDATP measures parsed and in Markdown."""
-        pbit_path = os.path.join(TEST_FILES, "MDATP_Status_Board.pbit")
-        if not os.path.exists(pbit_path):
-            pytest.skip("MDATP_Status_Board.pbit not downloaded")
-
-        upload_file_via_input(app, pbit_path)
-        wait_for_app(app)
+        assert markdown_contains(mdatp_app, "## Measures")["## Measures"]
+        assert count_dax_blocks(mdatp_app) > 0
 
-        md = app.evaluate("() => modelToMarkdown(appState.model, null)")
-        assert "## Measures" in md
-        assert "```dax" in md
-
-    def test_mdatp_diagram(self, app: Page):
+    @needs_mdatp
+    def test_mdatp_diagram(self, mdatp_app: Page):
         """Test MDATP renders in diagram."""
-        pbit_path = os.path.join(TEST_FILES, "MDATP_Status_Board.pbit")
-        if not os.path.exists(pbit_path):
-            pytest.skip("MDATP_Status_Board.pbit not downloaded")
-
-        upload_file_via_input(app, pbit_path)
-        wait_for_app(app)
-
-        click_tab(app, "diagram")
-        app.wait_for_timeout(1000)
+        # The page is shared with the tree tests, so always switch back to
+        # the Model tab whatever order the tests run in.
+        click_tab(mdatp_app, "diagram")
+        try:
+            wait_for_diagram(mdatp_app)
+            node_count = mdatp_app.evaluate("""() => {
+                if (!appState.cy) return 0;
+                return appState.cy.nodes().length;
+            }""")
+        finally:
+            click_tab(mdatp_app, "model")
 
-        node_count = app.evaluate("""() => {
-            if (!appState.cy) return 0;
-            return appState.cy.nodes().length;
-        }""")
         assert node_count >= 5, f"Expected >=5 diagram nodes, got {node_count}"
 
-    def test_tmdl_sales_model(self, app: Page):
+    @needs_tmdl_sales
+    def test_tmdl_sales_model(self, tmdl_sales_app: Page):
         """Test loading the Microsoft SamplePBIP TMDL model."""
-        zip_path = os.path.join(TEST_FILES, "tmdl-sales.zip")
-        if not os.path.exists(zip_path):
-            pytest.skip("tmdl-sales.zip not available")
-
-        upload_file_via_input(app, zip_path)
-        wait_for_app(app)
-
-        stats = get_header_stats(app)
+        stats = get_header_stats(tmdl_sales_app)
         assert "Tables" in stats
 
-        tree_text = app.text_content("#treeScroll")
-        for table_name in ["Sales", "Customer", "Product", "Calendar"]:
-            assert table_name in tree_text, f"Table '{table_name}' not found"
+        expect_tree_tables(tmdl_sales_app, ["Sales", "Customer", "Product", "Calendar"])
 
-    def test_tmdl_sales_measures(self, app: Page):
+    @needs_tmdl_sales
+    def test_tmdl_sales_measures(self, tmdl_sales_app: Page):
         """Test that TMDL Sales model has measures parsed."""
-        zip_path = os.path.join(TEST_FILES, "tmdl-sales.zip")
-        if not os.path.exists(zip_path):
-            pytest.skip("tmdl-sales.zip not available")
-
-        upload_file_via_input(app, zip_path)
-        wait_for_app(app)
-
-        stats = get_header_stats(app)
+        stats = get_header_stats(tmdl_sales_app)
         assert "Measures" in stats
 
-        md = app.evaluate("() => modelToMarkdown(appState.model, null)")
-        assert "```dax" in md
+        assert count_dax_blocks(tmdl_sales_app) > 0
 
-    def test_tmdl_sales_relationships(self, app: Page):
+    @needs_tmdl_sales
+    def test_tmdl_sales_relationships(self, tmdl_sales_app: Page):
         """Test that TMDL Sales model relationships are parsed."""
-        zip_path = os.path.join(TEST_FILES, "tmdl-sales.zip")
-        if not os.path.exists(zip_path):
-            pytest.skip("tmdl-sales.zip not available")
-
-        upload_file_via_input(app, zip_path)
-        wait_for_app(app)
-
-        stats = get_header_stats(app)
+        stats = get_header_stats(tmdl_sales_app)
         assert "Relationships" in stats
 
 
@@ -880,33 +992,21 @@ class TestDownloadedFiles:
 class TestPbixDataExtraction:
     """Tests for .pbix VertiPaq data extraction and Data tab."""
 
-    def test_pbix_loads_with_data_model(self, app: Page):
+    @needs_revenue_pbix
+    def test_pbix_loads_with_data_model(self, revenue_pbix_app: Page):
         """Test that a .pbix file loads and exposes a data model."""
-        pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
-        upload_file_via_input(app, pbix_path)
-        wait_for_app(app, timeout=30000)
-
-        badge = app.text_content("#modelFormat")
+        badge = revenue_pbix_app.text_content("#modelFormat")
         assert badge == "pbix"
 
-        stats = get_header_stats(app)
+        stats = get_header_stats(revenue_pbix_app)
         assert "8 Tables" in stats
         assert "6 Measures" in stats
         assert "5 Relationships" in stats
 
-    def test_pbix_data_tab_visible(self, app: Page):
+    @needs_revenue_pbix
+    def test_pbix_data_tab_visible(self, revenue_pbix_app: Page):
         """Test that Data tab button appears for .pbix files."""
-        pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
-        upload_file_via_input(app, pbix_path)
-        wait_for_app(app, timeout=30000)
-
-        display = app.evaluate(
+        display = revenue_pbix_app.evaluate(
             "() => document.getElementById('dataTabBtn').style.display"
         )
         assert display != "none", "Data tab should be visible for .pbix"
@@ -921,66 +1021,45 @@ class TestPbixDataExtraction:
         )
         assert display == "none", "Data tab should be hidden for .bim"
 
-    def test_pbix_no_internal_tables_in_data_tab(self, app: Page):
+    @needs_revenue_pbix
+    def test_pbix_no_internal_tables_in_data_tab(self, revenue_pbix_app: Page):
         """Test that internal tables (H$, R$, U$, etc.) are excluded from Data tab."""
-        pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
-        upload_file_via_input(app, pbix_path)
-        wait_for_app(app, timeout=30000)
-
-        table_names = app.evaluate(
-            "() => appState.model._pbixDataModel.tableNames"
+        internal = revenue_pbix_app.evaluate(
+            """() => appState.model._pbixDataModel.tableNames.filter(
+                n => /^(H\\$|R\\$|U\\$|LocalDateTable_|DateTableTemplate_)/.test(n))"""
         )
-        for name in table_names:
-            assert not name.startswith("H$"), f"Internal table in Data tab: {name}"
-            assert not name.startswith("R$"), f"Internal table in Data tab: {name}"
-            assert not name.startswith("U$"), f"Internal table in Data tab: {name}"
-            assert not name.startswith("LocalDateTable_"), f"Internal table: {name}"
-            assert not name.startswith("DateTableTemplate_"), f"Internal table: {name}"
-
-    def test_pbix_no_internal_tables_in_model_tab(self, app: Page):
-        """Test that internal tables are excluded from Model tab tree."""
-        pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
+        assert internal == [], f"Internal tables in Data tab: {internal}"
 
-        upload_file_via_input(app, pbix_path)
-        wait_for_app(app, timeout=30000)
-
-        table_names = app.evaluate(
-            "() => appState.model.tables.map(t => t.name)"
+    @needs_revenue_pbix
+    def test_pbix_no_internal_tables_in_model_tab(self, revenue_pbix_app: Page):
+        """Test that internal tables are excluded from Model tab tree."""
+        internal = revenue_pbix_app.evaluate(
+            """() => appState.model.tables.map(t => t.name).filter(
+                n => /^(H\\$|R\\$|U\\$)/.test(n))"""
         )
-        for name in table_names:
-            assert not name.startswith("H$"), f"Internal table in model: {name}"
-            assert not name.startswith("R$"), f"Internal table in model: {name}"
-            assert not name.startswith("U$"), f"Internal table in model: {name}"
+        assert internal == [], f"Internal tables in model: {internal}"
 
+    @needs_revenue_pbix
     def test_pbix_data_table_list(self, app: Page):
         """Test that the Data tab lists the expected user tables."""
         pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
         upload_file_via_input(app, pbix_path)
         wait_for_app(app, timeout=30000)
 
         click_tab(app, "data")
         app.wait_for_selector("#dataTableList .data-table-item", timeout=5000)
 
-        items = app.query_selector_all("#dataTableList .data-table-item")
-        table_names = [item.text_content() for item in items]
+        table_names = app.eval_on_selector_all(
+            "#dataTableList .data-table-item", "els => els.map(e => e.textContent)"
+        )
         assert len(table_names) == 8, f"Expected 8 user tables, got {len(table_names)}"
         for name in ["Account", "Fact", "Opportunity", "Partner", "Product", "SalesStage"]:
             assert name in table_names, f"Expected table '{name}' in Data tab"
 
+    @needs_revenue_pbix
     def test_pbix_extract_table_data(self, app: Page):
         """Test that clicking a table in Data tab extracts row data."""
         pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
         upload_file_via_input(app, pbix_path)
         wait_for_app(app, timeout=30000)
 
@@ -988,37 +1067,32 @@ class TestPbixDataExtraction:
         app.wait_for_selector("#dataTableList .data-table-item", timeout=5000)
 
         # Click the Account table
-        items = app.query_selector_all("#dataTableList .data-table-item")
-        for item in items:
-            if item.text_content() == "Account":
-                item.click()
-                break
+        app.locator(
+            "#dataTableList .data-table-item", has_text=re.compile(r"^Account$")
+        ).click()
 
         # Wait for data to render
         app.wait_for_selector(".data-table th", timeout=30000)
 
-        headers = app.query_selector_all(".data-table th")
-        header_names = [h.text_content() for h in headers]
-        assert len(header_names) > 0, "No column headers in data preview"
-
-        rows = app.query_selector_all(".data-table tbody tr")
-        assert len(rows) > 0, "No data rows in preview"
-
+        preview = app.evaluate("""() => ({
+            headers: document.querySelectorAll('.data-table th').length,
+            rows: document.querySelectorAll('.data-table tbody tr').length,
+            rowCount: document.getElementById('dataRowCount').textContent,
+        })""")
+        assert preview["headers"] > 0, "No column headers in data preview"
+        assert preview["rows"] > 0, "No data rows in preview"
         # Check row count display
-        row_count_text = app.text_content("#dataRowCount")
-        assert "rows" in row_count_text
+        assert "rows" in preview["rowCount"]
 
+    @needs_revenue_pbix
     def test_pbix_diagram_side_panel_opens_on_first_visit(self, app: Page):
         """Test diagram side panel opens on the first diagram visit (no tab switch workaround)."""
         pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
         upload_file_via_input(app, pbix_path)
         wait_for_app(app, timeout=30000)
 
         click_tab(app, "diagram")
-        app.wait_for_timeout(400)
+        wait_for_diagram(app)
 
         node_id = click_first_diagram_node(app)
         app.wait_for_function(
@@ -1030,77 +1104,54 @@ class TestPbixDataExtraction:
         assert panel_text is not None and node_id in panel_text, \
             "Side panel should open with clicked table details on first diagram visit"
 
+    @needs_revenue_pbix
     def test_pbix_export_buttons_enabled(self, app: Page):
         """Test that single-table and bulk export buttons are enabled after loading data."""
         pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
         upload_file_via_input(app, pbix_path)
         wait_for_app(app, timeout=30000)
 
         click_tab(app, "data")
         app.wait_for_selector("#dataTableList .data-table-item", timeout=5000)
 
-        items = app.query_selector_all("#dataTableList .data-table-item")
-        items[0].click()
+        app.locator("#dataTableList .data-table-item").first.click()
         app.wait_for_selector(".data-table th", timeout=30000)
 
-        csv_disabled = app.get_attribute("#exportCsvBtn", "disabled")
-        parquet_disabled = app.get_attribute("#exportParquetBtn", "disabled")
-        all_csv_disabled = app.get_attribute("#exportAllCsvBtn", "disabled")
-        all_parquet_disabled = app.get_attribute("#exportAllParquetBtn", "disabled")
-        assert csv_disabled is None, "CSV button should be enabled"
-        assert parquet_disabled is None, "Parquet button should be enabled"
-        assert all_csv_disabled is None, "Export All CSV button should be enabled"
-        assert all_parquet_disabled is None, "Export All Parquet button should be enabled"
+        disabled = export_buttons_disabled(app)
+        assert not disabled["csv"], "CSV button should be enabled"
+        assert not disabled["parquet"], "Parquet button should be enabled"
+        assert not disabled["allCsv"], "Export All CSV button should be enabled"
+        assert not disabled["allParquet"], "Export All Parquet button should be enabled"
 
+    @needs_revenue_pbix
     def test_pbix_export_all_buttons_enabled_without_selection(self, app: Page):
         """Test that bulk export is enabled before selecting a specific table."""
         pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
         upload_file_via_input(app, pbix_path)
         wait_for_app(app, timeout=30000)
 
         click_tab(app, "data")
         app.wait_for_selector("#dataTableList .data-table-item", timeout=5000)
 
-        csv_disabled = app.get_attribute("#exportCsvBtn", "disabled")
-        parquet_disabled = app.get_attribute("#exportParquetBtn", "disabled")
-        all_csv_disabled = app.get_attribute("#exportAllCsvBtn", "disabled")
-        all_parquet_disabled = app.get_attribute("#exportAllParquetBtn", "disabled")
-        assert csv_disabled is not None, "Single-table CSV button should be disabled before table selection"
-        assert parquet_disabled is not None, "Single-table Parquet button should be disabled before table selection"
-        assert all_csv_disabled is None, "Export All CSV button should be enabled"
-        assert all_parquet_disabled is None, "Export All Parquet button should be enabled"
+        disabled = export_buttons_disabled(app)
+        assert disabled["csv"], "Single-table CSV button should be disabled before table selection"
+        assert disabled["parquet"], "Single-table Parquet button should be disabled before table selection"
+        assert not disabled["allCsv"], "Export All CSV button should be enabled"
+        assert not disabled["allParquet"], "Export All Parquet button should be enabled"
 
-    def test_pbix_relationships_correct(self, app: Page):
+    @needs_revenue_pbix
+    def test_pbix_relationships_correct(self, revenue_pbix_app: Page):
         """Test that .pbix relationships are correctly parsed."""
-        pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
-        upload_file_via_input(app, pbix_path)
-        wait_for_app(app, timeout=30000)
-
-        rels = app.evaluate(
+        rels = revenue_pbix_app.evaluate(
             "() => appState.model.relationships.map(r => r.fromTable + '.' + r.fromColumn + '->' + r.toTable + '.' + r.toColumn)"
         )
         assert len(rels) == 5, f"Expected 5 relationships, got {len(rels)}"
         assert "Fact.Account ID->Account.Account ID" in rels
 
-    def test_pbix_csv_export_produces_data(self, app: Page):
+    @needs_revenue_pbix
+    def test_pbix_csv_export_produces_data(self, revenue_pbix_app: Page):
         """Test that CSV export produces correct output via internal function."""
-        pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
-        upload_file_via_input(app, pbix_path)
-        wait_for_app(app, timeout=30000)
-
-        csv_output = app.evaluate("""() => {
+        csv_output = revenue_pbix_app.evaluate("""() => {
             const data = appState.model._pbixDataModel.getTable('Account');
             return tableToCSV(data);
         }""")
@@ -1112,12 +1163,10 @@ class TestPbixDataExtraction:
         header = lines[0]
         assert "Account" in header or "Region" in header
 
+    @needs_revenue_pbix
     def test_pbix_no_double_export(self, app: Page):
         """Test that reloading a .pbix doesn't cause duplicate export handlers."""
         pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
         # Load the file twice to trigger re-init
         upload_file_via_input(app, pbix_path)
         wait_for_app(app, timeout=30000)
@@ -1144,12 +1193,10 @@ class TestPbixDataExtraction:
 
         assert download_count == 1, f"Expected 1 download, got {download_count}"
 
+    @needs_corporate_spend
     def test_pbix_corporate_spend(self, app: Page):
         """Test loading the Corporate_Spend .pbix file."""
         pbix_path = os.path.join(TEST_FILES, "Corporate_Spend.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Corporate_Spend.pbix not available")
-
         upload_file_via_input(app, pbix_path)
         wait_for_app(app, timeout=30000)
 
@@ -1169,16 +1216,10 @@ class TestPbixDataExtraction:
 class TestDataProfile:
     """Tests for the data profile (column stats) feature."""
 
-    def test_stats_checkbox_visible_for_pbix(self, app: Page):
+    @needs_revenue_pbix
+    def test_stats_checkbox_visible_for_pbix(self, revenue_pbix_app: Page):
         """Test that the data profile checkbox appears for .pbix files."""
-        pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
-        upload_file_via_input(app, pbix_path)
-        wait_for_app(app, timeout=30000)
-
-        display = app.evaluate(
+        display = revenue_pbix_app.evaluate(
             "() => document.getElementById('includeStatsHeaderWrap').style.display"
         )
         assert display != "none", "Stats checkbox should be visible for .pbix"
@@ -1193,16 +1234,10 @@ class TestDataProfile:
         )
         assert display == "none", "Stats checkbox should be hidden for .bim"
 
-    def test_compute_column_stats(self, app: Page):
+    @needs_revenue_pbix
+    def test_compute_column_stats(self, revenue_pbix_app: Page):
         """Test that _computeColumnStats produces correct stats."""
-        pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
-        upload_file_via_input(app, pbix_path)
-        wait_for_app(app, timeout=30000)
-
-        stats = app.evaluate("""() => {
+        stats = revenue_pbix_app.evaluate("""() => {
             const data = appState.model._pbixDataModel.getTable('Account');
             const col0 = data.columnData[0];
             const stat = _computeColumnStats(data.columns[0], col0);
@@ -1213,46 +1248,25 @@ class TestDataProfile:
         assert stats["distinct"] > 0
         assert stats["rowCount"] > 0
 
-    def test_stats_in_markdown_output(self, app: Page):
+    @needs_revenue_pbix
+    def test_stats_in_markdown_output(self, revenue_pbix_markdown: dict):
         """Test that stats appear in Markdown when statsMap is provided."""
-        pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
-        upload_file_via_input(app, pbix_path)
-        wait_for_app(app, timeout=30000)
-
-        md = app.evaluate("""async () => {
-            const statsMap = await computeAllStats(appState.model._pbixDataModel, () => {});
-            return modelToMarkdown(appState.model, null, statsMap);
-        }""")
+        md = revenue_pbix_markdown["withStats"]
 
         assert "**Data profile**" in md
         assert "distinct" in md
 
-    def test_stats_not_in_markdown_without_flag(self, app: Page):
+    @needs_revenue_pbix
+    def test_stats_not_in_markdown_without_flag(self, revenue_pbix_markdown: dict):
         """Test that stats do NOT appear in Markdown by default."""
-        pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
-        upload_file_via_input(app, pbix_path)
-        wait_for_app(app, timeout=30000)
-
-        md = app.evaluate("() => modelToMarkdown(appState.model, null)")
+        md = revenue_pbix_markdown["plain"]
 
         assert "**Data profile**" not in md
 
-    def test_pbix_calc_column_dax_extracted(self, app: Page):
+    @needs_revenue_pbix
+    def test_pbix_calc_column_dax_extracted(self, revenue_pbix_app: Page):
         """Test that calculated column DAX expressions are extracted from .pbix."""
-        pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
-        upload_file_via_input(app, pbix_path)
-        wait_for_app(app, timeout=30000)
-
-        calc_cols = app.evaluate("""() => {
+        calc_cols = revenue_pbix_app.evaluate("""() => {
             const result = [];
             for (const t of appState.model.tables) {
                 for (const c of t.columns) {
@@ -1266,27 +1280,19 @@ class TestDataProfile:
 
         assert len(calc_cols) > 0, "Should have extracted calc column DAX"
 
-    def test_pbix_calc_column_in_markdown(self, app: Page):
+    @needs_revenue_pbix
+    def test_pbix_calc_column_in_markdown(self, revenue_pbix_markdown: dict):
         """Test that calculated column DAX appears in Markdown for .pbix files."""
-        pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
-        upload_file_via_input(app, pbix_path)
-        wait_for_app(app, timeout=30000)
-
-        md = app.evaluate("() => modelToMarkdown(appState.model, null)")
+        md = revenue_pbix_markdown["plain"]
 
         assert "(calculated column)" in md, "Markdown should show calculated columns"
         assert "EstimatedCloseDate" in md, \
             "Markdown should contain calc column DAX expressions"
 
+    @needs_revenue_pbix
     def test_stats_checkbox_syncs(self, app: Page):
         """Test that header and footer stats checkboxes stay in sync."""
         pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
         upload_file_via_input(app, pbix_path)
         wait_for_app(app, timeout=30000)
 
@@ -1298,12 +1304,10 @@ class TestDataProfile:
         )
         assert footer_checked, "Footer checkbox should sync with header"
 
+    @needs_revenue_pbix
     def test_stats_checkbox_updates_token_badge_without_extra_clicks(self, app: Page):
         """Test token badge updates after enabling stats without requiring unrelated UI clicks."""
         pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
         upload_file_via_input(app, pbix_path)
         wait_for_app(app, timeout=30000)
 
@@ -1328,19 +1332,16 @@ class TestDataProfile:
 class TestDataTabReset:
     """Tests for Data tab state reset when loading new files."""
 
+    @needs_revenue_pbix
     def test_data_tab_clears_on_new_file(self, app: Page):
         """Test that Data tab preview is cleared when clicking New File."""
         pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
         # Load a .pbix and select a table in data tab
         upload_file_via_input(app, pbix_path)
         wait_for_app(app, timeout=30000)
         click_tab(app, "data")
         app.wait_for_selector("#dataTableList .data-table-item", timeout=5000)
-        items = app.query_selector_all("#dataTableList .data-table-item")
-        items[0].click()
+        app.locator("#dataTableList .data-table-item").first.click()
         app.wait_for_selector(".data-table th", timeout=30000)
 
         # Click New File
@@ -1359,13 +1360,12 @@ class TestDataTabReset:
             "Select a table" in preview_html, \
             "Data preview should be cleared after loading a non-.pbix file"
 
+    @needs_revenue_pbix
+    @needs_corporate_spend
     def test_data_tab_table_list_refreshes(self, app: Page):
         """Test that loading a second .pbix refreshes the table list."""
         pbix1 = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
         pbix2 = os.path.join(TEST_FILES, "Corporate_Spend.pbix")
-        if not os.path.exists(pbix1) or not os.path.exists(pbix2):
-            pytest.skip(".pbix files not available")
-
         upload_file_via_input(app, pbix1)
         wait_for_app(app, timeout=30000)
 
@@ -1406,7 +1406,7 @@ class TestEmptyModel:
         upload_file_via_input(app, os.path.join(TEST_FILES, "edge-empty-model.bim"))
         wait_for_app(app)
         click_tab(app, "diagram")
-        app.wait_for_timeout(500)
+        wait_for_diagram(app)
 
         # Should not crash — either empty diagram or no error
         error_visible = app.evaluate(
@@ -1462,7 +1462,7 @@ class TestSpecialCharacters:
                 }
             }
         }""")
-        app.wait_for_timeout(200)
+        expect(app.locator("#detailPanel")).to_contain_text("Table with Spaces")
 
         detail_html = app.evaluate("() => document.getElementById('detailPanel').innerHTML")
         assert "<script>" not in detail_html, "Detail panel should escape HTML"
@@ -1508,7 +1508,6 @@ class TestHiddenItems:
             cb.checked = true;
             cb.dispatchEvent(new Event('change'));
         }""")
-        app.wait_for_timeout(100)
 
         visible_on = app.evaluate(
             "() => document.querySelectorAll('.tree-item:not([style*=\"display: none\"])').length"
@@ -1541,7 +1540,7 @@ class TestSingleTable:
         upload_file_via_input(app, os.path.join(TEST_FILES, "edge-single-table.bim"))
         wait_for_app(app)
         click_tab(app, "diagram")
-        app.wait_for_timeout(500)
+        wait_for_diagram(app)
 
         node_count = app.evaluate(
             "() => appState.cy ? appState.cy.nodes().length : -1"
@@ -1587,7 +1586,7 @@ class TestManyTables:
         upload_file_via_input(app, os.path.join(TEST_FILES, "edge-many-tables.bim"))
         wait_for_app(app)
         click_tab(app, "diagram")
-        app.wait_for_timeout(500)
+        wait_for_diagram(app)
 
         node_count = app.evaluate(
             "() => appState.cy ? appState.cy.nodes().length : -1"
@@ -1604,7 +1603,6 @@ class TestManyTables:
             cb.checked = true;
             cb.dispatchEvent(new Event('change'));
         }""")
-        app.wait_for_timeout(100)
 
         md = app.evaluate(
             "() => modelToMarkdown(appState.model, appState.checkedItems)"
@@ -1626,7 +1624,6 @@ class TestStateManagement:
             const items = document.querySelectorAll('.tree-item');
             if (items.length > 0) items[0].click();
         }""")
-        app.wait_for_timeout(100)
 
         # Click New File
         app.evaluate("() => document.getElementById('newFileBtn').click()")
@@ -1661,12 +1658,10 @@ class TestStateManagement:
         count = app.evaluate("() => appState.checkedItems.size")
         assert count == 0, f"Checked items should be 0 after New File, got {count}"
 
+    @needs_revenue_pbix
     def test_new_file_resets_stats_cache(self, app: Page):
         """Test that stats cache is cleared on New File."""
         pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
         upload_file_via_input(app, pbix_path)
         wait_for_app(app, timeout=30000)
 
@@ -1684,12 +1679,10 @@ class TestStateManagement:
         cache_after = app.evaluate("() => appState.statsCache")
         assert cache_after is None, "Stats cache should be null after New File"
 
+    @needs_revenue_pbix
     def test_stats_checkbox_hidden_after_new_file(self, app: Page):
         """Test that stats checkbox hides when going from .pbix to .bim."""
         pbix_path = os.path.join(TEST_FILES, "Revenue_Opportunities.pbix")
-        if not os.path.exists(pbix_path):
-            pytest.skip("Revenue_Opportunities.pbix not available")
-
         upload_file_via_input(app, pbix_path)
         wait_for_app(app, timeout=30000)
 
@@ -1723,7 +1716,6 @@ class TestCopyEdgeCases:
 
         # Click copy selected
         app.click("#copySelectedBtn")
-        app.wait_for_timeout(500)
 
         # Should show a toast or at least not crash
         toast_text = app.evaluate(
@@ -1793,13 +1785,11 @@ class TestTabSwitching:
         wait_for_app(app)
 
         click_tab(app, "diagram")
-        app.wait_for_timeout(300)
+        wait_for_diagram(app)
         click_tab(app, "model")
-        app.wait_for_timeout(100)
 
         # Tree should still be visible
-        items = app.query_selector_all(".tree-item")
-        assert len(items) > 0, "Tree items should still be visible"
+        expect(app.locator(".tree-item").first, "Tree items should still be visible").to_be_visible()
 
 
 class TestDiagramEdgeCases:
@@ -1810,10 +1800,9 @@ class TestDiagramEdgeCases:
         upload_file_via_input(app, os.path.join(TEST_FILES, "test-model.bim"))
         wait_for_app(app)
         click_tab(app, "diagram")
-        app.wait_for_timeout(500)
+        wait_for_diagram(app)
 
         app.fill("#diagramSearch", "ZZZZZZNONEXISTENT")
-        app.wait_for_timeout(200)
 
         # All nodes should be dimmed/faded
         highlighted = app.evaluate(
@@ -1826,12 +1815,10 @@ class TestDiagramEdgeCases:
         upload_file_via_input(app, os.path.join(TEST_FILES, "test-model.bim"))
         wait_for_app(app)
         click_tab(app, "diagram")
-        app.wait_for_timeout(500)
+        wait_for_diagram(app)
 
         app.fill("#diagramSearch", "Sales")
-        app.wait_for_timeout(200)
         app.fill("#diagramSearch", "")
-        app.wait_for_timeout(200)
 
         # All nodes should be visible/normal
         dimmed = app.evaluate(
@@ -1853,7 +1840,6 @@ class TestTreeSearch:
         )
 
         app.fill("#treeSearch", "Sales")
-        app.wait_for_timeout(200)
 
         visible = app.evaluate("""() => {
             let count = 0;
@@ -1876,9 +1862,7 @@ class TestTreeSearch:
         )
 
         app.fill("#treeSearch", "Sales")
-        app.wait_for_timeout(100)
         app.fill("#treeSearch", "")
-        app.wait_for_timeout(100)
 
         total_after = app.evaluate("""() => {
             let count = 0;
@@ -1894,17 +1878,17 @@ class TestTreeSearch:
 class TestFileFormatDetection:
     """Tests for file format detection and error handling."""
 
-    def test_plain_text_file_shows_error(self, app: Page):
+    def test_plain_text_file_shows_error(self, app: Page, invalid_file: str):
         """Test that a random text file shows an error."""
-        upload_file_via_input(app, os.path.join(TEST_FILES, "invalid.txt"))
+        upload_file_via_input(app, invalid_file)
         app.wait_for_selector("#errorBanner", state="visible", timeout=5000)
 
         error_text = app.text_content("#errorBanner")
         assert len(error_text) > 0, "Error message should be displayed"
 
-    def test_empty_json_shows_error(self, app: Page):
+    def test_empty_json_shows_error(self, app: Page, empty_bim_file: str):
         """Test that empty JSON ({}) loads as empty model or shows error."""
-        upload_file_via_input(app, os.path.join(TEST_FILES, "empty.bim"))
+        upload_file_via_input(app, empty_bim_file)
         # Should either show an error or load as a model with 0 tables
         try:
             app.wait_for_selector("#errorBanner", state="visible", timeout=3000)
@@ -2003,11 +1987,10 @@ class TestColonInNames:
         upload_file_via_input(app, os.path.join(TEST_FILES, "edge-special-chars.bim"))
         wait_for_app(app)
         # Click first measure in tree
-        measure_items = app.query_selector_all('.tree-item[data-key^="measure:"]')
-        if len(measure_items) > 0:
-            measure_items[0].click()
-            detail = app.inner_html("#detailPanel")
-            assert "detail-code" in detail or "detail-title" in detail
+        app.locator('.tree-item[data-key^="measure:"]').first.click()
+        expect(
+            app.locator("#detailPanel").locator(".detail-title, .detail-code").first
+        ).to_be_visible()
 
 
 class TestPipeInMarkdown:
@@ -2087,7 +2070,7 @@ class TestTabResetOnNewFile:
         wait_for_app(app)
         # Switch to Diagram tab
         app.click('[data-tab="diagram"]')
-        app.wait_for_timeout(300)
+        wait_for_diagram(app)
         # Click New File
         app.click("#newFileBtn")
         app.wait_for_selector("#dropZone", state="visible")
@@ -2095,8 +2078,9 @@ class TestTabResetOnNewFile:
         upload_file_via_input(app, os.path.join(TEST_FILES, "edge-single-table.bim"))
         wait_for_app(app)
         # Check that Model tab is active
-        model_btn = app.query_selector('.tab-btn[data-tab="model"]')
-        assert "active" in model_btn.get_attribute("class"), "Model tab should be active after New File"
+        expect(
+            app.locator('.tab-btn[data-tab="model"]'), "Model tab should be active after New File"
+        ).to_have_class(re.compile(r"\bactive\b"))
 
     def test_diagram_tab_not_active_after_new_file(self, app: Page):
         """Diagram tab should not remain active after New File."""
@@ -2104,13 +2088,12 @@ class TestTabResetOnNewFile:
         wait_for_app(app)
         # Switch to Diagram tab
         app.click('[data-tab="diagram"]')
-        app.wait_for_timeout(300)
+        wait_for_diagram(app)
         # Click New File
         app.click("#newFileBtn")
         app.wait_for_selector("#dropZone", state="visible")
         # Verify diagram tab is not active
-        diagram_btn = app.query_selector('.tab-btn[data-tab="diagram"]')
-        assert "active" not in diagram_btn.get_attribute("class")
+        expect(app.locator('.tab-btn[data-tab="diagram"]')).not_to_have_class(re.compile(r"\bactive\b"))
 
 
 # ============================================================